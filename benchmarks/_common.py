@@ -0,0 +1,48 @@
+"""
+Helpers shared by the benchmark scripts: headless Qt setup, timing and JSON output.
+Metric names end with their unit: *_ms and *_us are times (lower is better), *_per_s are rates (higher is better).
+"""
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# benchmarks run without a display unless a platform is chosen explicitly
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def application():
+    """
+    QApplication instance (created on first use)
+    """
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def timings(func, repeat):
+    """
+    Run func() repeat times
+    :return: sorted list of wall times in seconds
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times
+
+
+def median(values):
+    return values[len(values) // 2]
+
+
+def dump(benchmark, results):
+    """
+    Print results as JSON document {"benchmark": name, "results": [...]}
+    """
+    json.dump({'benchmark': benchmark, 'results': results}, sys.stdout, indent=2)
+    sys.stdout.write('\n')
@@ -0,0 +1,75 @@
+"""
+Binding memory benchmark.
+Creates a View with N bound QLineEdit widgets and reports the Python memory allocated per binding
+(measured with tracemalloc, widgets and context are created beforehand and excluded) as JSON.
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_binding_memory.py [--bindings N]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication, QLineEdit  # noqa: E402
+
+from qtbind.interfaces import IPropertyChanged  # noqa: E402
+from qtbind.view import View  # noqa: E402
+
+
+class Context(IPropertyChanged):
+    """
+    Context with N plain attributes named f0..fN-1
+    """
+    def __init__(self, count):
+        super().__init__()
+        for i in range(count):
+            setattr(self, 'f%d' % i, str(i))
+
+
+class Form(View):
+    pass
+
+
+def measure(count):
+    widgets = [QLineEdit() for _ in range(count)]
+    context = Context(count)
+    form = Form(context=context)
+    names = ['f%d' % i for i in range(count)]
+    gc.collect()
+
+    objects_before = len(gc.get_objects())
+    tracemalloc.start()
+    start = time.perf_counter()
+    for name, widget in zip(names, widgets):
+        form.bind(name, widget, 'text')
+    elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects_after = len(gc.get_objects())
+
+    return {
+        'bindings': count,
+        'bytes_per_binding': round(allocated / count, 1),
+        'gc_objects_per_binding': round((objects_after - objects_before) / count, 2),
+        'create_us_per_binding': round(elapsed / count * 1e6, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bindings', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    json.dump({'benchmark': 'binding_memory', 'results': [measure(args.bindings)]}, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+View context swap benchmark.
+Measures the latency of assigning View.context for views with 10, 1000 and 10000 bindings (QLineEdit.text),
+alternating between two contexts with different values, and between two contexts with equal values
+(widget writes are skipped).
+Usage:
+    python benchmarks/bench_context_swap.py [--bindings N ...] [--repeat N]
+"""
+import argparse
+import sys
+
+from _common import application, dump, median, timings
+
+from PyQt5.QtWidgets import QLineEdit  # noqa: E402
+
+from qtbind.interfaces import IPropertyChanged  # noqa: E402
+from qtbind.view import View  # noqa: E402
+
+
+class Context(IPropertyChanged):
+    """
+    Context with N plain attributes named f0..fN-1
+    """
+    def __init__(self, count, prefix):
+        super().__init__()
+        for i in range(count):
+            setattr(self, 'f%d' % i, prefix + str(i))
+
+
+class Form(View):
+    pass
+
+
+def measure(count, repeat):
+    widgets = [QLineEdit() for _ in range(count)]
+    form = Form(context=Context(count, 'a'))
+    for i, widget in enumerate(widgets):
+        form.bind('f%d' % i, widget, 'text')
+
+    results = []
+    for case, contexts in (('different_values', (Context(count, 'b'), Context(count, 'c'))),
+                           ('equal_values', (Context(count, 'd'), Context(count, 'd')))):
+        state = {'next': 0}
+
+        def swap():
+            form.context = contexts[state['next']]
+            state['next'] ^= 1
+
+        swap()
+        times = timings(swap, repeat)
+        results.append({
+            'bindings': count,
+            'case': case,
+            'best_ms': round(times[0] * 1000.0, 3),
+            'median_ms': round(median(times) * 1000.0, 3),
+            'us_per_binding': round(median(times) / count * 1e6, 3),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bindings', type=int, action='append', help='bindings per view (default: 10, 1000, 10000)')
+    parser.add_argument('--repeat', type=int, default=11)
+    args = parser.parse_args(argv)
+
+    app = application()  # noqa: F841
+    results = []
+    for count in args.bindings or (10, 1000, 10000):
+        results.extend(measure(count, args.repeat))
+    dump('context_swap', results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
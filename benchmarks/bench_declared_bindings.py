@@ -0,0 +1,105 @@
+"""
+Declared bindings benchmark.
+Creates many instances of a View class with N bindings (QLineEdit.text) and reports the time taken to create
+the bindings of the first instance (including compiling the binding plan and resolving target accessors) and of
+later instances, for bindings declared in View.bindings (bind_declared()) and created imperatively with bind().
+The qt_only mode performs only the Qt work of each binding (connecting the widget's notify signal and writing the
+initial value), the part of the per-instance cost a binding plan cannot share.
+Widgets and contexts are created beforehand and excluded.
+Usage:
+    python benchmarks/bench_declared_bindings.py [--bindings N] [--instances N]
+"""
+import argparse
+import sys
+import time
+
+from _common import application, dump, median
+
+from PyQt5.QtWidgets import QLineEdit  # noqa: E402
+
+from qtbind import qtbind  # noqa: E402
+from qtbind.interfaces import IPropertyChanged  # noqa: E402
+from qtbind.view import View  # noqa: E402
+
+
+class Context(IPropertyChanged):
+    """
+    Context with N plain attributes named f0..fN-1
+    """
+    def __init__(self, count):
+        super().__init__()
+        for i in range(count):
+            setattr(self, 'f%d' % i, str(i))
+
+
+def declared_form(count):
+    """
+    New View class declaring count bindings (a new class, so its binding plan is not compiled yet)
+    """
+    bindings = tuple(('f%d' % i, '_w%d' % i, 'text') for i in range(count))
+    return type('DeclaredForm', (View,), {'bindings': bindings})
+
+
+def create_declared(form_class, context, widgets):
+    form = form_class(context=context)
+    for i, widget in enumerate(widgets):
+        setattr(form, '_w%d' % i, widget)
+    start = time.perf_counter()
+    form.bind_declared()
+    return time.perf_counter() - start
+
+
+def create_imperative(form_class, context, widgets):
+    form = form_class(context=context)
+    start = time.perf_counter()
+    for i, widget in enumerate(widgets):
+        form.bind('f%d' % i, widget, 'text')
+    return time.perf_counter() - start
+
+
+def create_qt_only(form_class, context, widgets):
+    form = form_class(context=context)
+    start = time.perf_counter()
+    for i, widget in enumerate(widgets):
+        widget.textChanged.connect(form.flush_context)
+        widget.setText(getattr(context, 'f%d' % i))
+    return time.perf_counter() - start
+
+
+_CREATE = {'qt_only': create_qt_only, 'imperative': create_imperative, 'declared': create_declared}
+
+
+def measure(mode, count, instances):
+    form_class = declared_form(count) if mode == 'declared' else type('Form', (View,), {})
+    create = _CREATE[mode]
+    contexts = [Context(count) for _ in range(instances)]
+    widgets = [[QLineEdit() for _ in range(count)] for _ in range(instances)]
+    # start from cold target accessors, as in a fresh process
+    qtbind._accessors.clear()
+
+    times = [create(form_class, context, row) for context, row in zip(contexts, widgets)]
+    later = sorted(times[1:]) or times
+    return {
+        'mode': mode,
+        'bindings': count,
+        'instances': instances,
+        'first_ms': round(times[0] * 1000.0, 3),
+        'last_ms': round(times[-1] * 1000.0, 3),
+        'median_ms': round(median(later) * 1000.0, 3),
+        'us_per_binding': round(median(later) / count * 1e6, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bindings', type=int, default=20, help='bindings per view')
+    parser.add_argument('--instances', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    app = application()  # noqa: F841
+    dump('declared_bindings', [measure(mode, args.bindings, args.instances) for mode in _CREATE])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
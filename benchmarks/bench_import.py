@@ -0,0 +1,74 @@
+"""
+Import time benchmark.
+Each entry point is imported in a fresh interpreter; the best of several runs is reported as JSON.
+Usage:
+    python benchmarks/bench_import.py [--repeat N] [--max-ms MODULE=MS ...]
+Exits with status 1 when an import exceeds its --max-ms limit.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = (
+    'qtbind',
+    'qtbind.interfaces',
+    'qtbind.viewmodel',
+    'qtbind.view',
+    'qtbind.loader',
+)
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+qt = sorted(m for m in sys.modules if m.startswith('PyQt5.'))
+print(elapsed * 1000.0, len(qt))
+"""
+
+
+def measure(module, repeat):
+    """
+    Import module in fresh interpreters
+    :return: dict with best/median time in milliseconds and number of loaded PyQt5 modules
+    """
+    times = []
+    qt_modules = 0
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', _PROBE.format(module=module)], cwd=ROOT)
+        elapsed, qt_modules = out.split()
+        times.append(float(elapsed))
+    times.sort()
+    return {
+        'module': module,
+        'best_ms': round(times[0], 2),
+        'median_ms': round(times[len(times) // 2], 2),
+        'qt_modules': int(qt_modules),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-ms', action='append', default=[], metavar='MODULE=MS',
+                        help='fail if best import time of MODULE exceeds MS')
+    args = parser.parse_args(argv)
+
+    limits = {}
+    for limit in args.max_ms:
+        module, ms = limit.split('=')
+        limits[module] = float(ms)
+
+    results = [measure(module, args.repeat) for module in MODULES]
+    failed = [r['module'] for r in results if r['module'] in limits and r['best_ms'] > limits[r['module']]]
+    json.dump({'benchmark': 'import', 'results': results, 'failed': failed}, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
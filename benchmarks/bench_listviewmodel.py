@@ -0,0 +1,108 @@
+"""
+ListViewModel benchmark at 100k rows.
+Measures append (one item per call), bulk extend, item property change throughput (including the coalesced
+dataChanged flush) and removal throughput from the end and from random rows.
+Usage:
+    python benchmarks/bench_listviewmodel.py [--rows N] [--changes N] [--removes N] [--random-removes N]
+                                             [--with-view]
+"""
+import argparse
+import random
+import sys
+import time
+
+from _common import application, dump
+
+from PyQt5.QtCore import Qt  # noqa: E402
+from PyQt5.QtWidgets import QListView  # noqa: E402
+
+from qtbind.viewmodel import ListViewModel, ViewModel, ViewModelProperty  # noqa: E402
+
+
+class Person:
+    def __init__(self, name):
+        self.name = name
+
+
+class PersonViewModel(ViewModel):
+    name = ViewModelProperty('name')
+
+
+def delegate(item, role):
+    if role == Qt.DisplayRole:
+        return item.name
+    return None
+
+
+def new_list(with_view):
+    vm = ListViewModel([], data_delegate=delegate)
+    view = None
+    if with_view:
+        view = QListView()
+        view.setModel(vm)
+    return vm, view
+
+
+def rate(name, count, elapsed, **extra):
+    result = {'operation': name, 'count': count}
+    result.update(extra)
+    result['us_per_op'] = round(elapsed / count * 1e6, 3)
+    result['ops_per_s'] = round(count / elapsed)
+    return result
+
+
+def measure(rows, changes, removes, random_removes, with_view):
+    results = []
+    items = [PersonViewModel(Person('p%d' % i)) for i in range(rows)]
+
+    vm, view = new_list(with_view)
+    start = time.perf_counter()
+    for item in items:
+        vm.append(item)
+    results.append(rate('append', rows, time.perf_counter() - start))
+
+    bulk, bulk_view = new_list(with_view)
+    others = [PersonViewModel(Person('q%d' % i)) for i in range(rows)]
+    start = time.perf_counter()
+    bulk.extend(others)
+    results.append(rate('extend', rows, time.perf_counter() - start))
+    del bulk, bulk_view, others
+
+    rng = random.Random(1)
+    targets = [items[rng.randrange(rows)] for _ in range(changes)]
+    start = time.perf_counter()
+    for i, item in enumerate(targets):
+        item.name = 'c%d' % i
+    vm.flush_changes()
+    results.append(rate('item_change', changes, time.perf_counter() - start, rows=rows))
+
+    start = time.perf_counter()
+    for _ in range(removes):
+        vm.remove_range(len(vm) - 1, 1)
+    results.append(rate('remove_last', removes, time.perf_counter() - start, rows=rows))
+
+    victims = [vm[rng.randrange(len(vm))] for _ in range(random_removes)]
+    victims = list({id(item): item for item in victims}.values())
+    start = time.perf_counter()
+    for item in victims:
+        vm.remove(item)
+    results.append(rate('remove_random', len(victims), time.perf_counter() - start, rows=len(vm) + len(victims)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--changes', type=int, default=100000)
+    parser.add_argument('--removes', type=int, default=1000, help='rows removed from the end')
+    parser.add_argument('--random-removes', type=int, default=200, help='rows removed from random positions')
+    parser.add_argument('--with-view', action='store_true', help='attach a QListView to the model')
+    args = parser.parse_args(argv)
+
+    app = application()  # noqa: F841
+    dump('listviewmodel', measure(args.rows, args.changes, args.removes, args.random_removes, args.with_view))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
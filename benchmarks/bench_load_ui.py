@@ -0,0 +1,126 @@
+"""
+load_ui benchmark on generated .ui files.
+Generates forms with N bound QLineEdit widgets and measures load_ui() time:
+    uic - XML parsed by the binding-aware uic loader on every load
+    compiled_cold - first load with an empty compiled cache (includes code generation)
+    compiled_disk - load of a compiled module cached on disk (new process)
+    compiled_warm - load of a compiled module already imported by this process
+Usage:
+    python benchmarks/bench_load_ui.py [--widgets N ...] [--repeat N]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from _common import application, dump, median, timings
+
+from PyQt5.QtWidgets import QWidget  # noqa: E402
+
+from qtbind import compiler  # noqa: E402
+from qtbind.interfaces import IPropertyChanged  # noqa: E402
+from qtbind.loader import load_ui  # noqa: E402
+from qtbind.view import View  # noqa: E402
+
+_UI_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>Form</class>
+ <widget class="QWidget" name="Form">
+  <layout class="QVBoxLayout" name="layout">
+'''
+
+_UI_ITEM = '''   <item>
+    <widget class="QLineEdit" name="edit{0}">
+     <property name="text">
+      <binding path="f{0}"/>
+     </property>
+    </widget>
+   </item>
+'''
+
+_UI_FOOTER = '''  </layout>
+ </widget>
+</ui>
+'''
+
+
+def generate_ui(path, count):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_UI_HEADER)
+        for i in range(count):
+            f.write(_UI_ITEM.format(i))
+        f.write(_UI_FOOTER)
+
+
+class Context(IPropertyChanged):
+    def __init__(self, count):
+        super().__init__()
+        for i in range(count):
+            setattr(self, 'f%d' % i, str(i))
+
+
+class Form(QWidget, View):
+    def __init__(self, context):
+        super().__init__()
+        View.__init__(self, context)
+
+
+def measure(count, repeat, workdir):
+    uifile = os.path.join(workdir, 'form%d.ui' % count)
+    generate_ui(uifile, count)
+    context = Context(count)
+    forms = []
+
+    def load(cache_dir=''):
+        form = Form(context)
+        load_ui(uifile, form, cache_dir=cache_dir)
+        forms.append(form)
+
+    cache_dir = os.path.join(workdir, 'cache%d' % count)
+    start = time.perf_counter()
+    load(cache_dir)
+    cold = time.perf_counter() - start
+
+    def load_from_disk():
+        compiler._loaded.clear()
+        load(cache_dir)
+
+    results = []
+    for case, times in (('uic', timings(load, repeat)),
+                        ('compiled_cold', [cold]),
+                        ('compiled_disk', timings(load_from_disk, repeat)),
+                        ('compiled_warm', timings(lambda: load(cache_dir), repeat))):
+        results.append({
+            'widgets': count,
+            'case': case,
+            'best_ms': round(times[0] * 1000.0, 2),
+            'median_ms': round(median(times) * 1000.0, 2),
+        })
+        for form in forms:
+            form.deleteLater()
+        del forms[:]
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--widgets', type=int, action='append', help='bound widgets per form (default: 100, 1000)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    app = application()  # noqa: F841
+    workdir = tempfile.mkdtemp(prefix='qtbind-bench-')
+    try:
+        results = []
+        for count in args.widgets or (100, 1000):
+            results.extend(measure(count, args.repeat, workdir))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    dump('load_ui', results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Binding propagation benchmark.
+Measures source -> target (context property change updating QLineEdit.text) and target -> source
+(QLineEdit.setText writing the context property) throughput, with one or several widgets bound to the property.
+Usage:
+    python benchmarks/bench_propagation.py [--updates N] [--fanout N ...]
+"""
+import argparse
+import sys
+
+from _common import application, dump, median, timings
+
+from PyQt5.QtWidgets import QLineEdit  # noqa: E402
+
+from qtbind.interfaces import IPropertyChanged  # noqa: E402
+from qtbind.view import View  # noqa: E402
+
+
+class Context(IPropertyChanged):
+    def __init__(self):
+        super().__init__()
+        self._value = ''
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, val):
+        self._value = val
+        self.notify_property_changed('value', val)
+
+
+class Form(View):
+    pass
+
+
+def measure(fanout, updates, repeat):
+    context = Context()
+    form = Form(context=context)
+    widgets = [QLineEdit() for _ in range(fanout)]
+    for widget in widgets:
+        form.bind('value', widget, 'text')
+    values = [str(i) for i in range(updates)]
+
+    def source_to_target():
+        for value in values:
+            context.value = value
+
+    widget = widgets[0]
+
+    def target_to_source():
+        for value in values:
+            widget.setText(value + '.')
+
+    results = []
+    for direction, func in (('source_to_target', source_to_target), ('target_to_source', target_to_source)):
+        elapsed = median(timings(func, repeat))
+        results.append({
+            'direction': direction,
+            'fanout': fanout,
+            'updates': updates,
+            'us_per_update': round(elapsed / updates * 1e6, 2),
+            'updates_per_s': round(updates / elapsed),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--updates', type=int, default=20000)
+    parser.add_argument('--fanout', type=int, action='append', help='widgets bound to the property (default: 1, 10)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    app = application()  # noqa: F841
+    results = []
+    for fanout in args.fanout or (1, 10):
+        results.extend(measure(fanout, args.updates, args.repeat))
+    dump('propagation', results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Run the benchmark suite headless (QT_QPA_PLATFORM=offscreen unless set) and report all results as one JSON document.
+Each benchmark script runs in a fresh interpreter.
+Usage:
+    python benchmarks/run_benchmarks.py [--quick] [--only NAME ...] [--output FILE]
+                                        [--compare BASELINE.json] [--tolerance 0.2]
+With --compare, metrics that are worse than the baseline by more than the tolerance are listed in "regressions"
+and the exit status is 1. Metric direction follows the name: *_ms, us_per_*, *_us_per_* and bytes_per_* are lower
+is better, *_per_s is higher is better.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# script, extra arguments for --quick runs
+BENCHMARKS = (
+    ('bench_import.py', ['--repeat', '3']),
+    ('bench_propagation.py', ['--updates', '2000', '--repeat', '3']),
+    ('bench_context_swap.py', ['--repeat', '3']),
+    ('bench_listviewmodel.py', ['--rows', '10000', '--changes', '10000', '--removes', '100', '--random-removes', '20']),
+    ('bench_load_ui.py', ['--repeat', '2']),
+    ('bench_binding_memory.py', ['--bindings', '2000']),
+    ('bench_declared_bindings.py', ['--instances', '100']),
+)
+
+
+def metric_direction(key):
+    """
+    1 if higher values are better, -1 if lower values are better, 0 for non-metric (identifying) fields
+    """
+    if key.endswith('_per_s'):
+        return 1
+    if key.endswith('_ms') or key.startswith(('us_per_', 'bytes_per_')) or '_us_per_' in key:
+        return -1
+    return 0
+
+
+def identity(result):
+    return tuple(sorted((key, value) for key, value in result.items() if metric_direction(key) == 0))
+
+
+def environment():
+    from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pyqt': PYQT_VERSION_STR,
+        'qt': QT_VERSION_STR,
+        'platform': platform.platform(),
+        'qpa_platform': os.environ['QT_QPA_PLATFORM'],
+    }
+
+
+def run(script, args):
+    """
+    Run benchmark script
+    :return: parsed JSON output
+    """
+    out = subprocess.check_output([sys.executable, os.path.join(HERE, script)] + args, cwd=HERE)
+    return json.loads(out)
+
+
+def compare(benchmarks, baseline, tolerance):
+    """
+    Metrics worse than baseline by more than tolerance (relative)
+    :return: list of dicts describing regressions
+    """
+    regressions = []
+    for name, results in benchmarks.items():
+        previous = {identity(result): result for result in baseline.get('benchmarks', {}).get(name, ())}
+        for result in results:
+            old = previous.get(identity(result))
+            if old is None:
+                continue
+            for key, value in result.items():
+                direction = metric_direction(key)
+                old_value = old.get(key)
+                if not direction or not old_value:
+                    continue
+                change = (value - old_value) / old_value
+                if -direction * change > tolerance:
+                    regressions.append({'benchmark': name, 'case': dict(identity(result)), 'metric': key,
+                                        'baseline': old_value, 'value': value, 'change': round(change, 3)})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quick', action='store_true', help='smaller sizes and fewer repetitions')
+    parser.add_argument('--only', action='append', metavar='NAME',
+                        help='run only given benchmark (e.g. propagation for bench_propagation.py)')
+    parser.add_argument('--output', help='write JSON to file instead of stdout')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON written by a previous run')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative slowdown (default: 0.2)')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    benchmarks = {}
+    for script, quick_args in BENCHMARKS:
+        name = script[len('bench_'):-len('.py')]
+        if args.only and name not in args.only:
+            continue
+        output = run(script, quick_args if args.quick else [])
+        benchmarks[output['benchmark']] = output['results']
+
+    report = {'environment': environment(), 'quick': args.quick, 'benchmarks': benchmarks}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            report['regressions'] = compare(benchmarks, json.load(f), args.tolerance)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return 1 if report.get('regressions') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,7 @@
 from PyQt5.QtCore import Qt
 
 from example.models.models import Person
-from qtbind.viewmodel import ViewModel, ViewModelProperty, ListViewModel
+from qtbind.viewmodel import ViewModel, ViewModelProperty, LazyListViewModel, computed
 
 
 class PersonViewModel(ViewModel):
@@ -14,6 +14,10 @@ class PersonViewModel(ViewModel):
     name = ViewModelProperty("name")
     family_name = ViewModelProperty("family_name")
 
+    @computed
+    def display_name(self):
+        return self.family_name + ", " + self.name
+
 
 class GroupViewModel(ViewModel):
     """
@@ -22,9 +26,9 @@ class GroupViewModel(ViewModel):
     def __init__(self, group):
         super().__init__(model=group)
         self._current = None
-        self._people = ListViewModel(group.people,
-                                     init=[PersonViewModel(p) for p in group.people],
-                                     data_delegate=self._person_delegate)
+        self._people = LazyListViewModel(group.people,
+                                         factory=PersonViewModel,
+                                         data_delegate=self._person_delegate)
 
     leader = ViewModelProperty("leader")
 
@@ -46,14 +50,12 @@ class GroupViewModel(ViewModel):
 
     def add_new_person(self):
         person = Person()
-        personvm = PersonViewModel(person)
-        self._peolpe.append(personvm)
-        self.model.people.append(person)
-        self._current = personvm
+        self._people.append(person)  # also appends person to model.people
+        self._current = self._people[-1]
         self.property_changed.emit('current', self._current)
         # self.property_changed.emit('people', self._people)  # shouldn't be required
 
     def _person_delegate(self, person, role):
         if role == Qt.DisplayRole:
-            return person.family_name + ", " + person.name
+            return person.display_name
         return None
@@ -1,9 +1,16 @@
 from PyQt5.QtWidgets import QGridLayout, QWidget, QLabel, QLineEdit
 
-from qtbind.view import View
+from qtbind.view import View, BindingSpec
 
 
 class PersonView(QWidget, View):
+    bindings = (
+        BindingSpec("name", "_name", "text", target_signal="editingFinished"),
+        BindingSpec("family_name", "_family_name", "text"),
+    )
+    # list selection may change the person several times per event loop iteration
+    coalesce_context_changes = True
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
 
@@ -16,8 +23,7 @@ class PersonView(QWidget, View):
         self._name = QLineEdit()
         self._family_name = QLineEdit()
 
-        self.bind("name", self._name, "text", target_signal="editingFinished")
-        self.bind("family_name", self._family_name, "text")
+        self.bind_declared()
 
         layout.addWidget(self._name, 0, 1)
         layout.addWidget(self._family_name, 1, 1)
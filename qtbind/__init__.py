@@ -1,6 +1,30 @@
-from .qtbind import BIND_WRITE, BIND_READ
-from .view import View
-from .loader import load_ui
-from .interfaces import IPropertyChanged, IQObjectPropertyChanged
+import importlib
 
-__all__ = ('BIND_READ', 'BIND_WRITE', 'View', 'load_ui', 'IPropertyChanged', 'IQObjectPropertyChanged')
+# Public names are imported lazily on first access (PEP 562), so that e.g. using IPropertyChanged
+# does not pull in QtWidgets or PyQt5.uic.
+_exports = {
+    'BIND_READ': '.qtbind',
+    'BIND_WRITE': '.qtbind',
+    'View': '.view',
+    'BindingSpec': '.view',
+    'load_ui': '.loader',
+    'IPropertyChanged': '.interfaces',
+    'IQObjectPropertyChanged': '.interfaces',
+    'CoalescingNotifier': '.interfaces',
+}
+
+__all__ = ('BIND_READ', 'BIND_WRITE', 'View', 'BindingSpec', 'load_ui', 'IPropertyChanged', 'IQObjectPropertyChanged',
+           'CoalescingNotifier')
+
+
+def __getattr__(name):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,209 @@
+"""
+Ahead-of-time compiler for .ui files with <binding> elements.
+Generates a Python module (pyuic5 style) with a setup_ui(baseinstance) function that builds the widgets
+and calls View.bind() directly, so loading the form does not parse XML.
+
+Command line usage:
+    python -m qtbind.compiler form.ui [-o form_ui.py]
+"""
+import argparse
+import hashlib
+import importlib.util
+import io
+import marshal
+import os
+import sys
+import types
+import xml.etree.ElementTree as ElementTree
+
+from PyQt5 import uic
+from PyQt5.QtCore import PYQT_VERSION_STR
+
+from .loader import parse_binding
+
+# bump when generated code changes to invalidate cached modules
+COMPILER_VERSION = 1
+
+_BINDINGS_CODE = '''
+
+from qtbind.view import find_view
+
+
+def _bind(widget, prop_name, path, flags, **options):
+    view = find_view(widget)
+    if view is None:
+        print('Error: failed to find view for ' + str(widget) + " and property " + prop_name)
+        return
+    view.bind(path, widget, prop_name, flags, **options)
+
+
+def setup_ui(baseinstance):
+    """
+    Build the form into baseinstance and apply bindings (same as qtbind.load_ui())
+    """
+    ui = {ui_class}()
+    ui.setupUi(baseinstance)
+    for name, value in vars(ui).items():
+        setattr(baseinstance, name, value)
+{bind_calls}    return baseinstance
+'''
+
+_loaded = {}
+
+
+def extract_bindings(ui_data):
+    """
+    Remove properties holding <binding> elements from .ui XML
+    :param ui_data: .ui file content (bytes)
+    :return: tuple of (XML without bindings, top-level class name, top-level widget name,
+             list of (widget name, property name, path, flags, options))
+    """
+    root = ElementTree.fromstring(ui_data)
+    top_widget = root.find('widget')
+    bindings = []
+    unnamed = 0
+
+    for widget in root.iter('widget'):
+        for prop in widget.findall('property'):
+            binding = prop.find('binding')
+            if binding is None:
+                continue
+            name = widget.get('name')
+            if not name:
+                # bound widgets must be addressable from the generated code
+                unnamed += 1
+                name = '_qtbind_widget_%d' % unnamed
+                widget.set('name', name)
+            bindings.append((name, prop.get('name')) + parse_binding(binding))
+            widget.remove(prop)
+
+    return ElementTree.tostring(root), root.findtext('class'), top_widget.get('name'), bindings
+
+
+def compile_ui(uifile, pyfile, resource_suffix='_rc'):
+    """
+    Generate Python module from binding-annotated .ui file
+    :param uifile: file name or binary file-like object
+    :param pyfile: text file-like object the code is written to
+    :param resource_suffix: same as uic.compileUi()
+    """
+    if isinstance(uifile, str):
+        with open(uifile, 'rb') as f:
+            ui_data = f.read()
+    else:
+        ui_data = uifile.read()
+    pyfile.write(generate(ui_data, resource_suffix))
+
+
+def generate(ui_data, resource_suffix='_rc'):
+    """
+    Generate Python module source from .ui file content
+    """
+    stripped, class_name, top_name, bindings = extract_bindings(ui_data)
+
+    out = io.StringIO()
+    uic.compileUi(io.BytesIO(stripped), out, resource_suffix=resource_suffix)
+
+    bind_calls = []
+    for widget_name, prop_name, path, flags, options in bindings:
+        widget = 'baseinstance' if widget_name == top_name else 'ui.' + widget_name
+        args = [widget, repr(prop_name), repr(path), repr(flags)]
+        args += ['%s=%r' % (name, value) for name, value in sorted(options.items())]
+        bind_calls.append('    _bind(%s)\n' % ', '.join(args))
+
+    out.write(_BINDINGS_CODE.format(ui_class='Ui_' + class_name, bind_calls=''.join(bind_calls)))
+    return out.getvalue()
+
+
+def cache_key(ui_data, resource_suffix='_rc'):
+    """
+    Cache key of the compiled module: hash of .ui content and code generator settings
+    """
+    digest = hashlib.sha1()
+    digest.update(('%d:%s:%s:' % (COMPILER_VERSION, PYQT_VERSION_STR, resource_suffix)).encode())
+    digest.update(ui_data)
+    return digest.hexdigest()
+
+
+def load_compiled(uifile, cache_dir, package='', resource_suffix='_rc'):
+    """
+    Get compiled module for .ui file, generating it into cache_dir if it is not cached yet.
+    The generated source (<key>.py) is cached with its bytecode (<key>.<cache tag>.pyc), so later processes
+    neither parse XML nor compile Python. Modules are also kept in memory for the lifetime of the process.
+    :return: module exposing setup_ui(baseinstance)
+    """
+    with open(uifile, 'rb') as f:
+        ui_data = f.read()
+    key = cache_key(ui_data, resource_suffix)
+
+    module = _loaded.get((key, package))
+    if module is not None:
+        return module
+
+    path = os.path.join(cache_dir, key + '.py')
+    code_path = os.path.join(cache_dir, '%s.%s.pyc' % (key, sys.implementation.cache_tag or 'code'))
+    code = _read_code(code_path)
+    if code is None:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        except FileNotFoundError:
+            source = generate(ui_data, resource_suffix)
+            _write_atomic(path, source.encode('utf-8'))
+        code = compile(source, path, 'exec')
+        _write_atomic(code_path, importlib.util.MAGIC_NUMBER + marshal.dumps(code))
+
+    module = types.ModuleType('qtbind_ui_' + key)
+    module.__file__ = path
+    module.__package__ = package or None
+    exec(code, module.__dict__)
+    _loaded[(key, package)] = module
+    return module
+
+
+def _read_code(path):
+    """
+    Code object cached in path, or None if it is missing or was written by another Python version
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    magic = importlib.util.MAGIC_NUMBER
+    if not data.startswith(magic):
+        return None
+    try:
+        return marshal.loads(data[len(magic):])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_atomic(path, data):
+    """
+    Write file so concurrent readers see either nothing or the complete content
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compile binding-annotated .ui file to Python')
+    parser.add_argument('uifile')
+    parser.add_argument('-o', '--output', help='output file (default: stdout)')
+    parser.add_argument('--resource-suffix', default='_rc')
+    args = parser.parse_args(argv)
+
+    if args.output is None:
+        compile_ui(args.uifile, sys.stdout, args.resource_suffix)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            compile_ui(args.uifile, f, args.resource_suffix)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
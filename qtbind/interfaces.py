@@ -1,21 +1,198 @@
-from PyQt5.Qt import pyqtSignal
+import threading
+import weakref
+from contextlib import contextmanager
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class Connection:
+    """
+    Token returned by Event.connect(). Disconnects exactly the handler it was created for.
+    """
+    __slots__ = ('_event', '_slot')
+
+    def __init__(self, event, slot):
+        self._event = event
+        self._slot = slot
+
+    @property
+    def connected(self):
+        return self._event is not None
+
+    def disconnect(self):
+        event, self._event = self._event, None
+        if event is None:
+            return
+        try:
+            event.remove(self._slot)
+        except ValueError:
+            pass
+
+
+class WeakMethodSlot:
+    """
+    Event handler that references a bound method weakly.
+    The slot removes itself from its event once the method's object is collected.
+    """
+    __slots__ = ('_method', '_event', '__weakref__')
+
+    def __init__(self, method, event):
+        self._event = weakref.ref(event)
+        self._method = weakref.WeakMethod(method, self._on_collected)
+
+    def __call__(self, *args, **kwargs):
+        method = self._method()
+        if method is not None:
+            method(*args, **kwargs)
+
+    def __eq__(self, other):
+        if isinstance(other, WeakMethodSlot):
+            return self is other
+        method = self._method()
+        return method is not None and method == other
+
+    __hash__ = object.__hash__
+
+    def _on_collected(self, ref):
+        event = self._event()
+        if event is not None:
+            try:
+                event.remove(self)
+            except ValueError:
+                pass
 
 
 class Event(list):
     """
-    Signal interface similar to Qt
+    Signal interface similar to Qt.
+    connect() returns a Connection token that can be passed to disconnect().
     """
-    def connect(self, func):
-        self.append(func)
+    def connect(self, func, weak=False):
+        """
+        Connect handler
+        :param func: callable
+        :param weak: reference bound method weakly - handler is dropped once its object is collected
+        :return: Connection token
+        """
+        slot = WeakMethodSlot(func, self) if weak else func
+        self.append(slot)
+        return Connection(self, slot)
 
     def disconnect(self, func):
-        self.remove(func)
+        """
+        Disconnect handler
+        :param func: callable passed to connect() or Connection token returned by it
+        """
+        if isinstance(func, Connection):
+            func.disconnect()
+        else:
+            self.remove(func)
 
     def emit(self, *args, **kwargs):
-        for func in self:
+        # iterate over a snapshot: handlers may disconnect themselves (or be dropped when collected) during emit
+        for func in tuple(self):
             func(*args, **kwargs)
 
 
+class PropertyChangedDispatcher:
+    """
+    Routes property_changed notifications to handlers registered for a specific property name.
+    Connects to the underlying signal once (on first subscription), so dispatch costs a dictionary
+    lookup plus the handlers that are actually interested in the changed property.
+    A notification with prop_name=None (all properties changed) is delivered to every handler.
+    Qt signals deliver None as an empty string, which is treated the same way.
+    Handlers are stored in tuples: cheap for the common single-subscriber case and safe to iterate
+    while handlers (un)subscribe during dispatch.
+    Fan-out (handlers invoked per notification) is recorded into every qtbind.profiling.FanoutStats added with
+    add_stats(), so several profilers can watch the same object independently.
+    """
+    __slots__ = ('_signal', '_handlers', '_connected', '_stats', '__weakref__')
+
+    def __init__(self, signal):
+        """
+        :param signal: property_changed signal (Event or bound Qt signal) to dispatch from
+        """
+        self._signal = signal
+        self._handlers = {}
+        self._connected = False
+        self._stats = ()
+
+    def subscribe(self, prop_name, func):
+        """
+        Register func(prop_name, value) to be called when prop_name changes
+        """
+        if not self._connected:
+            self._signal.connect(self._dispatch)
+            self._connected = True
+        self._handlers[prop_name] = self._handlers.get(prop_name, ()) + (func,)
+
+    def unsubscribe(self, prop_name, func):
+        """
+        Unregister previously subscribed handler
+        """
+        handlers = self._handlers.get(prop_name, ())
+        try:
+            index = handlers.index(func)
+        except ValueError:
+            return
+        handlers = handlers[:index] + handlers[index + 1:]
+        if handlers:
+            self._handlers[prop_name] = handlers
+        else:
+            del self._handlers[prop_name]
+
+    def add_stats(self, stats):
+        """
+        Start recording fan-out into stats (FanoutStats)
+        """
+        if stats not in self._stats:
+            self._stats += (stats,)
+
+    def remove_stats(self, stats):
+        """
+        Stop recording fan-out into stats; other registered stats are not affected
+        """
+        self._stats = tuple(s for s in self._stats if s is not stats)
+
+    def handler_count(self, prop_name=None):
+        """
+        Number of handlers subscribed to prop_name (or to all properties when prop_name is None)
+        """
+        if prop_name is None:
+            return sum(len(handlers) for handlers in self._handlers.values())
+        return len(self._handlers.get(prop_name, ()))
+
+    def _dispatch(self, prop_name, value):
+        if not prop_name:
+            all_handlers = list(self._handlers.values())
+            if self._stats:
+                count = sum(len(handlers) for handlers in all_handlers)
+                for stats in self._stats:
+                    stats.record(None, count)
+            for handlers in all_handlers:
+                for func in handlers:
+                    func(None, None)
+            return
+
+        handlers = self._handlers.get(prop_name, ())
+        if self._stats:
+            for stats in self._stats:
+                stats.record(prop_name, len(handlers))
+        for func in handlers:
+            func(prop_name, value)
+
+
+def property_dispatcher(obj):
+    """
+    Get (create on first use) per-property dispatcher for any object exposing property_changed signal
+    """
+    dispatcher = getattr(obj, '_property_dispatcher', None)
+    if dispatcher is None:
+        dispatcher = PropertyChangedDispatcher(obj.property_changed)
+        obj._property_dispatcher = dispatcher
+    return dispatcher
+
+
 class IPropertyChanged:
     """
     This class generates an event when a property is changed
@@ -23,21 +200,183 @@ class IPropertyChanged:
     prop_name - string or None when all properties are changed
     new_val - new property value
     Base interface is used for pure Python objects that do not inherit QObject.
+    Notifications sent through notify_property_changed() are deferred while inside batch_update().
     """
     def __init__(self):
         self._property_changed = Event()
+        self._property_dispatcher = None
+        self._batch_committed = Event()
+        self._batch_depth = 0
+        self._batch_pending = None
 
     @property
     def property_changed(self):
         return self._property_changed
 
+    @property
+    def batch_committed(self):
+        """
+        Emitted once after the outermost batch_update() completes.
+        The argument is a tuple of changed property names ((None,) when all properties changed).
+        """
+        return self._batch_committed
+
+    def notify_property_changed(self, prop_name, value):
+        """
+        Emit property_changed, or record the change if a batch update is in progress
+        """
+        pending = self._batch_pending
+        if pending is None:
+            self.property_changed.emit(prop_name, value)
+        elif None not in pending:
+            if not prop_name:
+                pending.clear()
+                prop_name = None
+            pending[prop_name] = value
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Defer change notifications until the outermost batch is exited.
+        On exit, one notification per distinct changed property is emitted with the last value.
+        Usage example:
+            with vm.batch_update():
+                vm.name = ...
+                vm.family_name = ...
+        """
+        if self._batch_depth == 0:
+            self._batch_pending = {}
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._commit_batch()
+
+    def _commit_batch(self):
+        pending, self._batch_pending = self._batch_pending, None
+        if not pending:
+            return
+        for prop_name, value in pending.items():
+            self.property_changed.emit(prop_name, value)
+        self.batch_committed.emit(tuple(pending))
+
+    def subscribe(self, prop_name, func):
+        """
+        Register func(prop_name, value) to be called only when prop_name changes
+        """
+        property_dispatcher(self).subscribe(prop_name, func)
+
+    def unsubscribe(self, prop_name, func):
+        """
+        Unregister handler previously registered with subscribe()
+        """
+        property_dispatcher(self).unsubscribe(prop_name, func)
+
 
 class IQObjectPropertyChanged(IPropertyChanged):
     """
     Overrides default implementation with Qt signal (offers thread safety).
     Derived classes must inherit QObject.
+    Per-property subscriptions are fed from a single connection to the Qt signal.
+    Each emit from a worker thread becomes one queued Qt event; use CoalescingNotifier for
+    high-frequency updates from worker threads.
     """
     def __init__(self):
         super().__init__()
 
     property_changed = pyqtSignal(str, object)
+    batch_committed = pyqtSignal(object)
+
+
+class CoalescingNotifier(QObject):
+    """
+    Thread-safe delivery of property changes to the GUI thread.
+    Worker threads call post(); changes are stored in a mutex-protected pending map keyed by (object, property).
+    The GUI thread drains the map at most once per interval and delivers only the latest value per key,
+    through notify_property_changed() of IPropertyChanged objects or property_changed.emit() otherwise.
+    Must be created in the GUI thread.
+    """
+    _wake = pyqtSignal()
+
+    def __init__(self, interval_ms=16, parent=None):
+        """
+        :param interval_ms: minimum delay between deliveries (16 ms ~ 60 frames per second)
+        """
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._posted = 0
+        self._dropped = 0
+        self._delivered = 0
+        self._max_depth = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.drain)
+        # queued to the GUI thread when emitted from a worker thread
+        self._wake.connect(self._schedule)
+
+    @property
+    def interval(self):
+        return self._timer.interval()
+
+    @interval.setter
+    def interval(self, interval_ms):
+        self._timer.setInterval(interval_ms)
+
+    @property
+    def queue_depth(self):
+        """
+        Number of distinct (object, property) changes waiting for delivery
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def stats(self):
+        """
+        Delivery statistics: posted, delivered, dropped (superseded by a newer value), queue depth and its maximum
+        """
+        with self._lock:
+            return {
+                'posted': self._posted,
+                'delivered': self._delivered,
+                'dropped': self._dropped,
+                'queue_depth': len(self._pending),
+                'max_queue_depth': self._max_depth,
+            }
+
+    def post(self, obj, prop_name, value):
+        """
+        Record property change of obj; may be called from any thread
+        """
+        key = (id(obj), prop_name)
+        with self._lock:
+            pending = self._pending
+            was_empty = not pending
+            if key in pending:
+                self._dropped += 1
+            pending[key] = (obj, prop_name, value)
+            self._posted += 1
+            if len(pending) > self._max_depth:
+                self._max_depth = len(pending)
+        if was_empty:
+            self._wake.emit()
+
+    def drain(self):
+        """
+        Deliver pending changes; must be called in the GUI thread
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._delivered += len(pending)
+        for obj, prop_name, value in pending.values():
+            if isinstance(obj, IPropertyChanged):
+                obj.notify_property_changed(prop_name, value)
+            else:
+                obj.property_changed.emit(prop_name, value)
+
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
@@ -1,9 +1,37 @@
+import os
+
 from PyQt5.uic.Loader.loader import DynamicUILoader
 from PyQt5.uic.properties import Properties
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from .qtbind import BIND_READ, BIND_WRITE
-from .view import View
+from .view import find_view
+
+MODE_FLAGS = {
+    'READ': BIND_READ,
+    'WRITE': BIND_WRITE,
+    'READ_WRITE': BIND_READ | BIND_WRITE
+}
+
+RATE_LIMIT_ATTRIBUTES = ('debounce_ms', 'throttle_ms', 'source_throttle_ms')
+
+# environment variable enabling the compiled .ui cache for all load_ui() calls
+CACHE_DIR_ENV = 'QTBIND_UI_CACHE_DIR'
+
+
+def parse_binding(binding_elem):
+    """
+    Parse <binding> element
+    :return: tuple of (path, flags, dict of additional View.bind() keyword arguments)
+    """
+    bind_path = binding_elem.attrib['path']
+    flags = MODE_FLAGS[binding_elem.get('mode', 'READ_WRITE')]
+    options = {name: int(binding_elem.attrib[name])
+               for name in RATE_LIMIT_ATTRIBUTES
+               if name in binding_elem.attrib}
+    if binding_elem.get('skip_equal', '').lower() in ('1', 'true'):
+        options['skip_equal'] = True
+    return bind_path, flags, options
 
 
 class CustomProperties(Properties):
@@ -56,25 +84,14 @@ class CustomProperties(Properties):
 
     def apply_binding(self, widget, prop_name, binding_elem):
         # find widget parent that implements View
-        view = widget
-
-        while view is not None and not isinstance(view, View):
-            view = view.parent()
+        view = find_view(widget)
 
         if view is None:
             print('Error: failed to find view for ' + str(widget) + " and property " + prop_name)
             return
 
-        bind_path = binding_elem.attrib['path']
-        bind_mode = binding_elem.get('mode', 'READ_WRITE')
-        mode_to_flags = {
-            'READ': BIND_READ,
-            'WRITE': BIND_WRITE,
-            'READ_WRITE': BIND_READ | BIND_WRITE
-        }
-        flags = mode_to_flags[bind_mode]
-
-        view.bind(bind_path, widget, prop_name, flags)
+        bind_path, flags, options = parse_binding(binding_elem)
+        view.bind(bind_path, widget, prop_name, flags, **options)
 
 
 class CustomUILoader(DynamicUILoader):
@@ -89,8 +106,19 @@ class CustomUILoader(DynamicUILoader):
         return res
 
 
-def load_ui(uifile, baseinstance, package='', resource_suffix="_rc"):
+def load_ui(uifile, baseinstance, package='', resource_suffix="_rc", cache_dir=None):
     """
     Same arguments as uic.loadUi()
+    :param cache_dir: directory of the compiled .ui cache (default: $QTBIND_UI_CACHE_DIR).
+                      When set, the .ui file is compiled to Python once per content hash and
+                      later calls run the generated code instead of parsing XML.
+                      Forms loaded without baseinstance are always parsed, as the generated code builds
+                      into an existing top-level widget.
     """
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir and isinstance(uifile, str) and baseinstance is not None:
+        from .compiler import load_compiled
+        load_compiled(uifile, cache_dir, package, resource_suffix).setup_ui(baseinstance)
+        return baseinstance
     return CustomUILoader(package).loadUi(uifile, baseinstance, resource_suffix)
@@ -0,0 +1,163 @@
+"""
+Opt-in instrumentation of bindings and property change notifications.
+Profiling is enabled per binding (Binding.enable_profiling()) or per view (View.enable_profiling());
+disabled bindings only pay for a None check.
+"""
+from time import perf_counter
+
+READ = 'read'  # source -> target
+WRITE = 'write'  # target -> source
+
+# default storm detection: more than STORM_THRESHOLD updates of one binding within STORM_WINDOW_MS
+STORM_THRESHOLD = 100
+STORM_WINDOW_MS = 1000
+
+REPORT_COLUMNS = ('reads', 'writes', 'time_ms', 'converter_ms', 'setter_ms', 'loops', 'storms')
+
+
+class BindingStats:
+    """
+    Update counters and timings of one binding.
+    Times are in seconds. A loop is an update of the binding started while another update of the same binding
+    in the same direction is in progress (feedback through other bindings or handlers); the echo of a target write
+    back to the target is not a loop. A storm is flagged when more than storm_threshold updates happen within
+    storm_window_ms.
+    """
+    __slots__ = ('name', 'reads', 'writes', 'read_time', 'write_time', 'converter_time', 'setter_time',
+                 'loops', 'storms', '_storm_threshold', '_storm_window', '_on_alert', '_active',
+                 '_window_start', '_window_count')
+
+    def __init__(self, name, storm_threshold=STORM_THRESHOLD, storm_window_ms=STORM_WINDOW_MS, on_alert=None):
+        """
+        :param name: binding description used in reports
+        :param on_alert: optional callable(stats, kind) called when a loop or storm is detected
+                         (kind is 'loop' or 'storm')
+        """
+        self.name = name
+        self.reads = 0
+        self.writes = 0
+        self.read_time = 0.0
+        self.write_time = 0.0
+        self.converter_time = 0.0
+        self.setter_time = 0.0
+        self.loops = 0
+        self.storms = 0
+        self._storm_threshold = storm_threshold
+        self._storm_window = storm_window_ms / 1000.0
+        self._on_alert = on_alert
+        self._active = set()
+        self._window_start = 0.0
+        self._window_count = 0
+
+    def run(self, direction, func, *args):
+        """
+        Call func(*args) performing an update in given direction (READ or WRITE) and record it
+        """
+        nested = direction in self._active
+        if nested:
+            self.loops += 1
+            self._alert('loop')
+        else:
+            self._active.add(direction)
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            end = perf_counter()
+            if not nested:
+                self._active.discard(direction)
+            if direction == READ:
+                self.reads += 1
+                self.read_time += end - start
+            else:
+                self.writes += 1
+                self.write_time += end - start
+
+            if end - self._window_start > self._storm_window:
+                self._window_start = end
+                self._window_count = 0
+            self._window_count += 1
+            if self._window_count == self._storm_threshold + 1:
+                self.storms += 1
+                self._alert('storm')
+
+    def timed_converter(self, func):
+        """
+        Wrap value converter so that its run time is added to converter_time.
+        The original converter is available as __wrapped__ of the result.
+        """
+        if func is None:
+            return None
+
+        def converter(value):
+            start = perf_counter()
+            try:
+                return func(value)
+            finally:
+                self.converter_time += perf_counter() - start
+        converter.__wrapped__ = func
+        return converter
+
+    def as_dict(self):
+        return {
+            'binding': self.name,
+            'reads': self.reads,
+            'writes': self.writes,
+            'time_ms': (self.read_time + self.write_time) * 1000.0,
+            'converter_ms': self.converter_time * 1000.0,
+            'setter_ms': self.setter_time * 1000.0,
+            'loops': self.loops,
+            'storms': self.storms,
+        }
+
+    def _alert(self, kind):
+        if self._on_alert is not None:
+            self._on_alert(self, kind)
+
+
+class FanoutStats:
+    """
+    Number of handlers invoked per property_changed notification, per property name
+    (None for "all properties changed" notifications).
+    """
+    __slots__ = ('notifications', 'handlers', 'max_handlers')
+
+    def __init__(self):
+        self.notifications = {}
+        self.handlers = {}
+        self.max_handlers = {}
+
+    def record(self, prop_name, handler_count):
+        self.notifications[prop_name] = self.notifications.get(prop_name, 0) + 1
+        self.handlers[prop_name] = self.handlers.get(prop_name, 0) + handler_count
+        if handler_count > self.max_handlers.get(prop_name, 0):
+            self.max_handlers[prop_name] = handler_count
+
+    def as_dict(self):
+        """
+        prop_name -> dict of notifications, mean_fanout and max_fanout
+        """
+        return {prop_name: {'notifications': count,
+                            'mean_fanout': self.handlers[prop_name] / count,
+                            'max_fanout': self.max_handlers[prop_name]}
+                for prop_name, count in self.notifications.items()}
+
+
+def format_report(rows, sort_by='time_ms', limit=None):
+    """
+    Format binding statistics as a text table sorted by given column (descending)
+    :param rows: sequence of BindingStats.as_dict() results
+    :param limit: maximum number of rows
+    """
+    rows = sorted(rows, key=lambda row: row[sort_by], reverse=True)
+    if limit is not None:
+        rows = rows[:limit]
+    width = max([len('binding')] + [len(row['binding']) for row in rows])
+    lines = ['%-*s  %s' % (width, 'binding', '  '.join('%12s' % column for column in REPORT_COLUMNS))]
+    for row in rows:
+        values = []
+        for column in REPORT_COLUMNS:
+            value = row[column]
+            values.append('%12.3f' % value if isinstance(value, float) else '%12d' % value)
+        lines.append('%-*s  %s' % (width, row['binding'], '  '.join(values)))
+    return '\n'.join(lines)
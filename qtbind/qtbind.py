@@ -1,67 +1,538 @@
-from PyQt5.QtWidgets import QTextEdit
+import sys
+from functools import partial
+from time import perf_counter
+
+from PyQt5.QtCore import QModelIndex, QObject, QTimer, Qt, pyqtProperty, pyqtSignal
+
+from .interfaces import property_dispatcher
+from .profiling import BindingStats, READ, WRITE, STORM_THRESHOLD, STORM_WINDOW_MS
 
 BIND_READ = 1
 BIND_WRITE = 2
 
+_UNSET = object()
+
+
+def default_equals(a, b):
+    """
+    Default value comparator of equality-aware bindings
+    """
+    return a is b or a == b
+
+
+class RateLimiter:
+    """
+    Coalesces calls to a callback using a single-shot QTimer.
+    In debounce mode the callback runs once calls stop arriving for interval_ms.
+    In throttle mode the callback runs at most once per interval_ms (on leading and trailing edge).
+    Only the arguments of the last call are delivered.
+    """
+    __slots__ = ('_callback', '_interval', '_debounce', '_timer', '_pending', '_args', '__weakref__')
+
+    def __init__(self, callback, interval_ms, debounce=False):
+        self._callback = callback
+        self._interval = interval_ms
+        self._debounce = debounce
+        self._timer = None
+        self._pending = False
+        self._args = ()
+
+    def __call__(self, *args):
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._on_timeout)
+
+        if self._debounce:
+            self._args = args
+            self._pending = True
+            self._timer.start(self._interval)
+        elif self._timer.isActive():
+            self._args = args
+            self._pending = True
+        else:
+            self._callback(*args)
+            self._timer.start(self._interval)
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def flush(self):
+        """
+        Deliver pending call immediately
+        """
+        if not self._pending:
+            return
+        self._timer.stop()
+        self._fire()
+
+    def cancel(self):
+        """
+        Drop pending call
+        """
+        self._pending = False
+        self._args = ()
+        if self._timer is not None:
+            self._timer.stop()
+
+    def _on_timeout(self):
+        if not self._pending:
+            return
+        self._fire()
+        if not self._debounce:
+            self._timer.start(self._interval)
+
+    def _fire(self):
+        args = self._args
+        self._pending = False
+        self._args = ()
+        self._callback(*args)
+
 
-class SimpleLock:
+class PropertyPath:
+    """
+    Observes a dotted source property path, e.g. "current.name".
+    Each segment subscribes to property_changed of its owner. When an intermediate object changes, only
+    the subscriptions below it are torn down and rebuilt. Owners without property_changed are read but not
+    observed.
     """
-    Simple context lock.
-    Usage example:
-        with self._lock:
-            ...
+    __slots__ = ('_segments', '_owners', '_handlers', '_callback')
+
+    def __init__(self, path, callback):
+        """
+        :param path: dotted property path
+        :param callback: callable(prop_name, value) invoked when the value at the end of the path changes
+        """
+        self._segments = tuple(path.split('.'))
+        self._owners = [None] * len(self._segments)
+        self._handlers = tuple(partial(self._on_changed, level) for level in range(len(self._segments)))
+        self._callback = callback
+
+    @property
+    def leaf(self):
+        """
+        Name of the last path segment
+        """
+        return self._segments[-1]
+
+    def set_root(self, root, dispatcher=None):
+        """
+        Observe the path starting at root
+        :param dispatcher: property dispatcher of root, if already resolved
+        """
+        self._detach(0)
+        self._attach(0, root, dispatcher)
+
+    def value(self):
+        """
+        Current value at the end of the path (None if an intermediate object is None)
+        """
+        owner = self._owners[-1]
+        return getattr(owner, self._segments[-1]) if owner is not None else None
+
+    def set_value(self, value):
+        owner = self._owners[-1]
+        if owner is not None:
+            setattr(owner, self._segments[-1], value)
+
+    def _attach(self, level, owner, dispatcher=None):
+        segments = self._segments
+        owners = self._owners
+        last = len(segments) - 1
+        for i in range(level, last + 1):
+            owners[i] = owner
+            if owner is None:
+                continue
+            if i != level or dispatcher is None:
+                dispatcher = property_dispatcher(owner) if hasattr(owner, 'property_changed') else None
+            if dispatcher is not None:
+                dispatcher.subscribe(segments[i], self._handlers[i])
+            if i < last:
+                owner = getattr(owner, segments[i], None)
+
+    def _detach(self, level):
+        segments = self._segments
+        owners = self._owners
+        for i in range(level, len(segments)):
+            owner = owners[i]
+            if owner is not None and hasattr(owner, 'property_changed'):
+                property_dispatcher(owner).unsubscribe(segments[i], self._handlers[i])
+            owners[i] = None
 
-        if self._lock:
-            continue
+    def _on_changed(self, level, prop, value):
+        if level == len(self._segments) - 1:
+            self._callback(prop, value)
+            return
+        # intermediate object replaced: rebuild subscriptions below it only
+        self._detach(level + 1)
+        self._attach(level + 1, getattr(self._owners[level], self._segments[level], None))
+        self._callback(self._segments[-1], self.value())
+
+
+class FutureRelay(QObject):
     """
+    Delivers completed futures to callbacks in the thread the relay lives in (the GUI thread).
+    """
+    _done = pyqtSignal(object, object)
+
     def __init__(self):
-        self._locked = 0
+        super().__init__()
+        self._done.connect(self._on_done)
 
-    def __enter__(self):
-        self._locked += 1
-        return self
+    def watch(self, future, callback):
+        """
+        Call callback(future) in the relay thread once future completes
+        """
+        future.add_done_callback(lambda f: self._done.emit(callback, f))
+
+    def _on_done(self, callback, future):
+        callback(future)
+
+
+_relay = None
+_default_executor = None
+
+
+def future_relay():
+    """
+    Shared FutureRelay (created on first use, which must happen in the GUI thread)
+    """
+    global _relay
+    if _relay is None:
+        _relay = FutureRelay()
+    return _relay
+
+
+def default_executor():
+    """
+    Shared thread pool used by asynchronous bindings created with executor=True
+    """
+    global _default_executor
+    if _default_executor is None:
+        # imported on first use: concurrent.futures and asyncio noticeably slow down importing qtbind
+        from concurrent.futures import ThreadPoolExecutor
+        _default_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='qtbind')
+    return _default_executor
+
+
+def _resolve(value):
+    """
+    Run awaitable results of asynchronous getters to completion (in the worker thread)
+    """
+    if hasattr(value, '__await__'):
+        import asyncio
+
+        async def wait():
+            return await value
+        return asyncio.run(wait())
+    return value
+
+
+class AsyncSource:
+    """
+    Reads a binding's source value on an executor instead of the GUI thread.
+    Only the result of the latest request is applied; older pending requests are cancelled.
+    """
+    __slots__ = ('_executor', '_getter', '_placeholder', '_future', '_generation', '_written')
+
+    def __init__(self, executor, getter=None, placeholder=None):
+        """
+        :param executor: concurrent.futures.Executor, or True for default_executor()
+        :param getter: callable(source) or coroutine function reading the value (default: source property)
+        :param placeholder: target value displayed until the value is ready (None: keep current value)
+        """
+        self._executor = default_executor() if executor is True else executor
+        self._getter = getter
+        self._placeholder = placeholder
+        self._future = None
+        self._generation = 0
+        self._written = _UNSET
+
+    @property
+    def placeholder(self):
+        return self._placeholder
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self._locked -= 1
-        return False
+    def source_written(self, value):
+        """
+        The binding wrote value (from the target) to the source: the pending request is dropped,
+        and the source's notification of value is not fetched again
+        """
+        self.cancel()
+        self._written = value
+
+    def is_echo(self, value):
+        """
+        Check (once) if a source notification reports the value written by source_written()
+        """
+        written = self._written
+        self._written = _UNSET
+        return written is not _UNSET and (written is value or written == value)
+
+    def fetch(self, source, read, callback):
+        """
+        Start reading the value
+        :param source: binding source passed to getter
+        :param read: callable returning the source value (used when no getter was given)
+        :param callback: callable(value) invoked in the GUI thread with the result of the latest request
+        """
+        self.cancel()
+        generation = self._generation
+        getter = self._getter
+        if getter is not None:
+            future = self._executor.submit(lambda: _resolve(getter(source)))
+        else:
+            future = self._executor.submit(lambda: _resolve(read()))
+        self._future = future
+        future_relay().watch(future, partial(self._on_done, generation, callback))
+
+    def cancel(self):
+        """
+        Drop the pending request
+        """
+        self._generation += 1
+        self._written = _UNSET
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    def _on_done(self, generation, callback, future):
+        if generation != self._generation or future.cancelled():
+            return
+        self._future = None
+        error = future.exception()
+        if error is not None:
+            sys.excepthook(type(error), error, error.__traceback__)
+            return
+        callback(future.result())
+
+
+class TargetAccessor:
+    """
+    Resolved reflection data for a (widget class, property name) pair.
+    Instances are shared process-wide through target_accessor(), so bindings call precomputed
+    getter/setter callables instead of inspecting the target on every update.
+    """
+    def __init__(self, target_type, prop_name):
+        """
+        :param target_type: widget class
+        :param prop_name: target property name
+        """
+        self.prop_name = prop_name
+        self.meta_property = self._find_meta_property(target_type, prop_name)
+        self.getter = self._make_getter(target_type, prop_name)
+        self.setter = self._make_setter(target_type, prop_name)
+        self.signal = self._signal_name(prop_name)
+
+    @property
+    def has_property(self):
+        """
+        True if the property is declared in the target's meta object
+        """
+        return self.meta_property is not None
+
+    @staticmethod
+    def _find_meta_property(target_type, prop_name):
+        meta = getattr(target_type, 'staticMetaObject', None)
+        if meta is None:
+            return None
+        index = meta.indexOfProperty(prop_name)
+        return meta.property(index) if index >= 0 else None
+
+    def _make_getter(self, target_type, prop_name):
+        # QtWidgets is imported lazily: targets are widgets, so it is already loaded by now
+        from PyQt5.QtWidgets import QTextEdit
+        if issubclass(target_type, QTextEdit) and prop_name == 'text':
+            return QTextEdit.toPlainText
+        if isinstance(getattr(target_type, prop_name, None), (property, pyqtProperty)):
+            # Python-defined property: read it directly (QMetaProperty.read can't convert None objects)
+            return lambda target: getattr(target, prop_name)
+        meta_prop = self.meta_property
+        if meta_prop is not None:
+            return meta_prop.read
+        return lambda target: target.property(prop_name)
+
+    @staticmethod
+    def _make_setter(target_type, prop_name):
+        # QT way:
+        method = getattr(target_type, "set" + prop_name[0].upper() + prop_name[1:], None)
+        if method is not None:
+            return method
+        # Python way
+        prop_desc = getattr(target_type, prop_name, None)
+        if prop_desc is not None and hasattr(prop_desc, 'setter'):
+            return lambda target, val: setattr(target, prop_name, val)
+
+        def fail(target, val):
+            raise(Exception("Don't know how to assign " + prop_name + " on target"))
+        return fail
+
+    def _signal_name(self, prop_name):
+        meta_prop = self.meta_property
+        if meta_prop is not None and meta_prop.hasNotifySignal():
+            return bytes(meta_prop.notifySignal().name()).decode()
+        return prop_name + "Changed"
+
+
+_accessors = {}
+
+
+def target_accessor(target_type, prop_name):
+    """
+    Get cached TargetAccessor for given widget class and property name
+    """
+    key = (target_type, prop_name)
+    accessor = _accessors.get(key)
+    if accessor is None:
+        accessor = _accessors[key] = TargetAccessor(target_type, prop_name)
+    return accessor
+
+
+class BindingTemplate:
+    """
+    Source- and target-independent part of a binding, shared by all bindings created from it
+    (e.g. by all instances of a View class declaring the binding).
+    Options are resolved once, and the target accessor and notify signal once per widget class,
+    so creating a binding from a template only attaches the given source and target.
+    """
+    __slots__ = ('source_prop', 'target_prop', 'flags', 'target_signal', 'source_to_target', 'target_to_source',
+                 'equals', 'debounce_ms', 'throttle_ms', 'source_throttle_ms', 'executor', 'getter', 'placeholder',
+                 '_targets')
+
+    def __init__(self, source_prop, target_prop, flags=(BIND_READ | BIND_WRITE), target_signal=None,
+                 source_to_target=None, target_to_source=None,
+                 debounce_ms=None, throttle_ms=None, source_throttle_ms=None,
+                 skip_equal=False, comparator=None,
+                 executor=None, getter=None, placeholder=None):
+        """
+        Same arguments as Binding, except source and target
+        """
+        self.source_prop = source_prop
+        self.target_prop = target_prop
+        self.flags = flags
+        self.target_signal = target_signal
+        self.source_to_target = source_to_target
+        self.target_to_source = target_to_source
+        self.equals = comparator or (default_equals if skip_equal else None)
+        self.debounce_ms = debounce_ms
+        self.throttle_ms = throttle_ms
+        self.source_throttle_ms = source_throttle_ms
+        self.executor = executor
+        self.getter = getter
+        self.placeholder = placeholder
+        self._targets = {}
+
+    def target_info(self, target_type):
+        """
+        TargetAccessor and name of the notify signal for given widget class
+        :return: (TargetAccessor, signal name)
+        """
+        info = self._targets.get(target_type)
+        if info is None:
+            accessor = target_accessor(target_type, self.target_prop)
+            info = self._targets[target_type] = (accessor, self.target_signal or accessor.signal)
+        return info
 
-    def __bool__(self):
-        return self._locked > 0
+    def create(self, source, target, dispatcher=None):
+        """
+        Create a binding of source to target
+        :param dispatcher: property dispatcher of source, if already resolved
+        :return: Binding
+        """
+        return Binding.from_template(self, source, target, dispatcher)
 
 
 class Binding:
     """
     Binds changes to source property with target widget property.
+    Uses __slots__ and an integer reentrancy counter to keep per-binding memory small in very large forms.
     """
+    __slots__ = ('_source', '_source_prop', '_path', '_target', '_target_prop', '_target_signal', '_flags',
+                 '_source_to_target', '_target_to_source', '_accessor', '_updating',
+                 '_target_limiter', '_source_limiter', '_equals', '_last_source', '_last_target', '_skipped',
+                 '_async', '_stats', '__weakref__')
+
     def __init__(self,
                  source, source_prop,
                  target, target_prop,
                  flags=(BIND_READ | BIND_WRITE),
                  target_signal=None,
-                 source_to_target=None, target_to_source=None):
+                 source_to_target=None, target_to_source=None,
+                 debounce_ms=None, throttle_ms=None, source_throttle_ms=None,
+                 skip_equal=False, comparator=None,
+                 executor=None, getter=None, placeholder=None):
         """
         Create a new binding
         :param source: source object
-        :param source_prop: source property name
+        :param source_prop: source property name or dotted path (e.g. "current.name")
         :param target: target widget
         :param target_prop: target property name
         :param flags: combination of BIND_READ/BIND_WRITE
         :param source_to_target: a value converter callback source -> target
         :param target_to_source: a value converter callback target -> source
+        :param debounce_ms: write target -> source only after target stops changing for given time
+        :param throttle_ms: write target -> source at most once per given time
+        :param source_throttle_ms: update source -> target at most once per given time
+        :param skip_equal: remember last value exchanged in each direction and skip writes of equal values
+        :param comparator: callable(a, b) -> bool used instead of == by skip_equal (implies skip_equal)
+        :param executor: read source values asynchronously on this concurrent.futures.Executor
+                         (True for a shared thread pool); stale results are dropped
+        :param getter: asynchronous mode: callable(source) or coroutine function producing the value
+        :param placeholder: asynchronous mode: target value shown until the value is ready
         """
+        self._init(source_prop, target_prop, flags, target_signal, source_to_target, target_to_source,
+                   comparator or (default_equals if skip_equal else None), debounce_ms, throttle_ms,
+                   source_throttle_ms, AsyncSource(executor, getter, placeholder) if executor else None)
+        self.source = source
+        self.target = target
+
+    @classmethod
+    def from_template(cls, template, source, target, dispatcher=None):
+        """
+        Create a binding configured by a BindingTemplate
+        :param dispatcher: property dispatcher of source, if already resolved
+        """
+        self = cls.__new__(cls)
+        self._init(template.source_prop, template.target_prop, template.flags, template.target_signal,
+                   template.source_to_target, template.target_to_source, template.equals, template.debounce_ms,
+                   template.throttle_ms, template.source_throttle_ms,
+                   AsyncSource(template.executor, template.getter, template.placeholder) if template.executor else None)
+        if target is not None:
+            self._target = target
+            self._accessor, signal = template.target_info(type(target))
+            if self._flags & BIND_WRITE:
+                getattr(target, signal).connect(self._on_target_changed)
+        self.set_source(source, dispatcher)
+        return self
+
+    def _init(self, source_prop, target_prop, flags, target_signal, source_to_target, target_to_source, equals,
+              debounce_ms, throttle_ms, source_throttle_ms, async_source):
         self._source = None
         self._source_prop = source_prop
+        self._path = PropertyPath(source_prop, self._on_source_changed) if '.' in source_prop else None
         self._target = None
         self._target_prop = target_prop
         self._target_signal = target_signal
         self._flags = flags
         self._source_to_target = source_to_target
         self._target_to_source = target_to_source
-        self._target_has_prop = True
-        self._update_lock = SimpleLock()
+        self._accessor = None
+        self._updating = 0
+        self._target_limiter = None
+        self._source_limiter = None
+        self._equals = equals
+        self._last_source = _UNSET
+        self._last_target = _UNSET
+        self._skipped = 0
+        self._async = async_source
+        self._stats = None
 
-        self.source = source
-        self.target = target
+        if debounce_ms:
+            self._target_limiter = RateLimiter(self._update_source, debounce_ms, debounce=True)
+        elif throttle_ms:
+            self._target_limiter = RateLimiter(self._update_source, throttle_ms)
+        if source_throttle_ms:
+            self._source_limiter = RateLimiter(self._update_target, source_throttle_ms)
 
     @property
     def source(self):
@@ -69,18 +540,78 @@ class Binding:
 
     @source.setter
     def source(self, val):
+        self.set_source(val)
+
+    def set_source(self, val, dispatcher=None, sync=True):
+        """
+        Re-point the binding to a new source
+        :param dispatcher: property dispatcher of val (lets callers switching many bindings resolve it once)
+        :param sync: synchronize target with the new source immediately
+        """
         if self._source == val:
             return
 
-        if self._source is not None:
-            self._source.property_changed.disconnect(self._on_source_changed)
+        self._flush_pending()
+
+        if self._path is not None:
+            self._path.set_root(val, dispatcher)
+        elif self._source is not None:
+            property_dispatcher(self._source).unsubscribe(self._source_prop, self._on_source_changed)
 
         self._source = val
+        self._last_source = self._last_target = _UNSET
 
-        if self._source is not None:
-            self._source.property_changed.connect(self._on_source_changed)
+        if val is not None and self._path is None:
+            if dispatcher is None:
+                dispatcher = property_dispatcher(val)
+            dispatcher.subscribe(self._source_prop, self._on_source_changed)
 
-        self._sync()
+        if sync:
+            self._sync()
+
+    @property
+    def skipped_updates(self):
+        """
+        Number of writes skipped because the value did not change (equality-aware bindings only)
+        """
+        return self._skipped
+
+    @property
+    def stats(self):
+        """
+        BindingStats of the binding or None if profiling is disabled
+        """
+        return self._stats
+
+    def enable_profiling(self, storm_threshold=STORM_THRESHOLD, storm_window_ms=STORM_WINDOW_MS, on_alert=None):
+        """
+        Start recording update counts and timings (see qtbind.profiling.BindingStats)
+        :return: BindingStats
+        """
+        if self._stats is not None:
+            return self._stats
+        target = self._target
+        target_name = type(target).__name__
+        if target is not None and hasattr(target, 'objectName') and target.objectName():
+            target_name += '(%s)' % target.objectName()
+        stats = BindingStats('%s -> %s.%s' % (self._source_prop, target_name, self._target_prop),
+                             storm_threshold, storm_window_ms, on_alert)
+        self._source_to_target = stats.timed_converter(self._source_to_target)
+        self._target_to_source = stats.timed_converter(self._target_to_source)
+        self._stats = stats
+        return stats
+
+    def disable_profiling(self):
+        """
+        Stop recording statistics
+        """
+        stats, self._stats = self._stats, None
+        if stats is not None:
+            # converters were wrapped by BindingStats.timed_converter()
+            if self._source_to_target is not None:
+                self._source_to_target = self._source_to_target.__wrapped__
+            if self._target_to_source is not None:
+                self._target_to_source = self._target_to_source.__wrapped__
 
     @property
     def target_signal(self):
@@ -89,6 +620,8 @@ class Binding:
         """
         if self._target_signal is not None:
             return self._target_signal
+        if self._accessor is not None:
+            return self._accessor.signal
         return self._target_prop + "Changed"
 
     @property
@@ -100,82 +633,510 @@ class Binding:
         if self._target == val:
             return
 
-        event_name = self.target_signal
+        self._flush_pending()
 
         if self._target is not None and self._flags & BIND_WRITE:
-            getattr(self._target, event_name).disconnect(self._on_target_changed)
+            getattr(self._target, self.target_signal).disconnect(self._on_target_changed)
 
         self._target = val
+        self._last_source = self._last_target = _UNSET
 
         if self._target is not None:
-            meta = self._target.metaObject()
-            self._target_has_prop = False
-            for i in range(meta.propertyCount()):
-                prop = meta.property(i)
-                if prop.name() == self._target_prop:
-                    self._target_has_prop = True
-                    break
-
-        if self._target is not None and self._flags & BIND_WRITE:
-            getattr(self._target, event_name).connect(self._on_target_changed)
+            self._accessor = target_accessor(type(self._target), self._target_prop)
+            if self._flags & BIND_WRITE:
+                getattr(self._target, self.target_signal).connect(self._on_target_changed)
 
         self._sync()
 
+    def flush(self):
+        """
+        Deliver rate-limited updates that are still pending
+        """
+        if self._target_limiter is not None:
+            self._target_limiter.flush()
+        if self._source_limiter is not None:
+            self._source_limiter.flush()
+
+    def _flush_pending(self):
+        """
+        Called before source or target is replaced: pending writes go to the old source,
+        pending target updates are superseded by the following sync.
+        """
+        if self._target_limiter is not None:
+            self._target_limiter.flush()
+        if self._source_limiter is not None:
+            self._source_limiter.cancel()
+        if self._async is not None:
+            self._async.cancel()
+
     def _on_source_changed(self, prop, value):
         """
-        Called when source values changes
+        Called when source values changes.
+        Only notifications for the bound property (or None for all properties) are dispatched here.
+        """
+        if self._source_limiter is not None:
+            self._source_limiter(prop, value)
+        else:
+            self._update_target(prop, value)
+
+    def _update_target(self, prop, value, skip_equal=False):
+        """
+        Push source value to the target
+        :param skip_equal: do not write the target if it already shows the value
+        """
+        if self._async is not None:
+            # the echo of our own write: the target already shows the value
+            if not (prop and self._async.is_echo(value)):
+                self._fetch_async()
+            return
+
+        if not prop:
+            if self._source is None:
+                return
+            value = self._get_source_value()
+
+        self._apply_source_value(value, skip_equal)
+
+    def _fetch_async(self):
+        """
+        Asynchronous mode: read the source value on the executor, show placeholder meanwhile
         """
-        if prop is not None and prop != self._source_prop:
+        if self._source is None:
+            self._async.cancel()
             return
+        if self._async.placeholder is not None and self._target is not None:
+            self._set_target_value(self._async.placeholder)
+            self._last_target = _UNSET
+        self._async.fetch(self._source, self._get_source_value, self._apply_source_value)
+
+    def _apply_source_value(self, value, skip_equal=False):
+        """
+        Convert source value and write it to the target
+        """
+        if self._stats is not None:
+            self._stats.run(READ, self._write_target, value, skip_equal)
+        else:
+            self._write_target(value, skip_equal)
+
+    def _write_target(self, value, skip_equal):
+        equals = self._equals
+        if equals is not None:
+            self._last_source = value
 
         if self._source_to_target is not None:
             value = self._source_to_target(value)
 
-        if self._target is not None:
-            self._set_target_value(value)
+        if self._target is None:
+            return
+        if equals is not None:
+            last = self._last_target
+            if last is not _UNSET and equals(last, value):
+                self._skipped += 1
+                return
+        elif skip_equal and self._get_target_value() == value:
+            return
+        self._set_target_value(value)
+        if equals is not None:
+            self._last_target = value
 
     def _on_target_changed(self):
         """
         Called when target value changes
         """
-        if self._update_lock:
+        if self._updating:
             return
 
-        if self._source is not None:
-            value = self._get_target_value()
-            if self._target_to_source is not None:
-                value = self._target_to_source(value)
+        if self._target_limiter is not None:
+            self._target_limiter()
+        else:
+            self._update_source()
+
+    def _update_source(self):
+        """
+        Write current target value to the source
+        """
+        if self._stats is not None:
+            self._stats.run(WRITE, self._write_source)
+        else:
+            self._write_source()
+
+    def _write_source(self):
+        if self._source is None or self._target is None:
+            return
+
+        value = self._get_target_value()
+        equals = self._equals
+        if equals is not None:
+            last = self._last_target
+            if last is not _UNSET and equals(last, value):
+                self._skipped += 1
+                return
+            self._last_target = value
+
+        if self._target_to_source is not None:
+            value = self._target_to_source(value)
+
+        if equals is not None:
+            last = self._last_source
+            if last is not _UNSET and equals(last, value):
+                self._skipped += 1
+                return
+            self._last_source = value
+        if self._async is not None:
+            self._async.source_written(value)
+        if self._path is not None:
+            self._path.set_value(value)
+        else:
             setattr(self._source, self._source_prop, value)
 
     def _get_source_value(self):
+        if self._path is not None:
+            return self._path.value()
         return getattr(self._source, self._source_prop)
 
     def _get_target_value(self):
-        if isinstance(self._target, QTextEdit) and self._target_prop == 'text':
-            return self._target.property('plainText')
-        return self._target.property(self._target_prop)
+        return self._accessor.getter(self._target)
 
     def _set_target_value(self, val):
-        with self._update_lock:
-            method = "set" + self._target_prop[0].upper() + self._target_prop[1:]
-            # QT way:
-            if hasattr(self._target, method):
-                getattr(self._target, method)(val)
-                return
-            # Python way
-            prop_desc = getattr(type(self._target), self._target_prop, None)
-            if prop_desc is None or not hasattr(prop_desc, 'setter'):
-                raise(Exception("Don't know how to assign " + self._target_prop + " on target"))
-            setattr(self._target, self._target_prop, val)
+        self._updating += 1
+        try:
+            stats = self._stats
+            if stats is None:
+                self._accessor.setter(self._target, val)
+            else:
+                start = perf_counter()
+                self._accessor.setter(self._target, val)
+                stats.setter_time += perf_counter() - start
+        finally:
+            self._updating -= 1
 
-    def _sync(self):
+    def sync(self):
         """
         Synchronize source and target values
         """
+        self._sync()
+
+    def _sync(self):
+        """
+        Synchronize source and target values.
+        The target is not written when it already shows the source value.
+        """
         if self._source is None or self._target is None:
             return
 
         if self._flags & BIND_READ:
-            self._on_source_changed(self._source_prop, self._get_source_value())
+            if self._async is not None:
+                self._fetch_async()
+            else:
+                self._update_target(self._source_prop, self._get_source_value(), skip_equal=True)
         elif self._flags & BIND_WRITE:
-            self._on_target_changed(self._get_target_value())
+            self._update_source()
+
+
+class ItemWidgetAdapter:
+    """
+    Uniform item operations of item-based widgets (see item_adapter())
+    """
+    __slots__ = ('widget',)
+
+    def __init__(self, widget):
+        self.widget = widget
+
+
+class ComboBoxItems(ItemWidgetAdapter):
+    __slots__ = ()
+
+    def texts(self):
+        widget = self.widget
+        return [widget.itemText(row) for row in range(widget.count())]
+
+    def insert(self, row, texts):
+        self.widget.insertItems(row, texts)
+
+    def remove(self, row, count):
+        for _ in range(count):
+            self.widget.removeItem(row)
+
+    def set_text(self, row, text):
+        self.widget.setItemText(row, text)
+
+    def current(self):
+        return self.widget.currentIndex()
+
+    def set_current(self, row):
+        self.widget.setCurrentIndex(row)
+
+
+class ListWidgetItems(ItemWidgetAdapter):
+    __slots__ = ()
+
+    def texts(self):
+        widget = self.widget
+        return [widget.item(row).text() for row in range(widget.count())]
+
+    def insert(self, row, texts):
+        self.widget.insertItems(row, texts)
+
+    def remove(self, row, count):
+        for _ in range(count):
+            self.widget.takeItem(row)
+
+    def set_text(self, row, text):
+        self.widget.item(row).setText(text)
+
+    def current(self):
+        return self.widget.currentRow()
+
+    def set_current(self, row):
+        self.widget.setCurrentRow(row)
+
+
+def item_adapter(widget):
+    """
+    Get item adapter for QComboBox or QListWidget
+    """
+    # QtWidgets is imported lazily: targets are widgets, so it is already loaded by now
+    from PyQt5.QtWidgets import QComboBox, QListWidget
+    if isinstance(widget, QComboBox):
+        return ComboBoxItems(widget)
+    if isinstance(widget, QListWidget):
+        return ListWidgetItems(widget)
+    raise TypeError("collection bindings support QComboBox and QListWidget, got %s" % type(widget).__name__)
+
+
+class CollectionBinding:
+    """
+    Keeps the items of a QComboBox or QListWidget in sync with a list held by a source property.
+    A list model value (e.g. ListViewModel) is observed: its row insert/remove/move and dataChanged notifications
+    are applied to the widget as the same delta. A plain sequence is re-read when the property changes and only the
+    differing middle part of the item list is replaced. The current item is preserved (moves included).
+    Read-only: bind the widget's currentIndex/currentRow with a regular Binding to track selection.
+    """
+    __slots__ = ('_source', '_source_prop', '_path', '_target', '_items', '_display', '_collection', '_connections',
+                 '_texts', '_stats', '__weakref__')
+
+    def __init__(self, source, source_prop, target, display=None):
+        """
+        :param source: source object
+        :param source_prop: source property name or dotted path holding the list
+        :param target: QComboBox or QListWidget
+        :param display: callable(item) -> str producing item text
+                        (default: DisplayRole data for list models, str() otherwise)
+        """
+        self._source = None
+        self._source_prop = source_prop
+        self._path = PropertyPath(source_prop, self._on_source_changed) if '.' in source_prop else None
+        self._target = None
+        self._items = None
+        self._display = display
+        self._collection = None
+        self._connections = ()
+        self._texts = []
+        self._stats = None
+
+        self.source = source
+        self.target = target
+
+    @property
+    def source(self):
+        return self._source
+
+    @source.setter
+    def source(self, val):
+        self.set_source(val)
+
+    def set_source(self, val, dispatcher=None, sync=True):
+        """
+        Re-point the binding to a new source (same as Binding.set_source())
+        """
+        if self._source == val:
+            return
+
+        if self._path is not None:
+            self._path.set_root(val, dispatcher)
+        elif self._source is not None:
+            property_dispatcher(self._source).unsubscribe(self._source_prop, self._on_source_changed)
+
+        self._source = val
+
+        if val is not None and self._path is None:
+            if dispatcher is None:
+                dispatcher = property_dispatcher(val)
+            dispatcher.subscribe(self._source_prop, self._on_source_changed)
+
+        if sync:
+            self._sync()
+
+    @property
+    def target(self):
+        return self._target
+
+    @target.setter
+    def target(self, val):
+        if self._target == val:
+            return
+        self._target = val
+        self._items = item_adapter(val) if val is not None else None
+        self._texts = self._items.texts() if val is not None else []
+        self._sync()
+
+    @property
+    def skipped_updates(self):
+        return 0
+
+    @property
+    def stats(self):
+        return self._stats
+
+    def enable_profiling(self, storm_threshold=STORM_THRESHOLD, storm_window_ms=STORM_WINDOW_MS, on_alert=None):
+        """
+        Record item updates as source -> target updates (see Binding.enable_profiling())
+        """
+        if self._stats is None:
+            self._stats = BindingStats('%s -> %s.items' % (self._source_prop, type(self._target).__name__),
+                                       storm_threshold, storm_window_ms, on_alert)
+        return self._stats
+
+    def disable_profiling(self):
+        self._stats = None
+
+    def flush(self):
+        pass
+
+    def sync(self):
+        """
+        Synchronize widget items with the source list
+        """
+        self._sync()
+
+    def _sync(self):
+        collection = None
+        if self._source is not None:
+            collection = self._path.value() if self._path is not None else getattr(self._source, self._source_prop)
+        self._set_collection(collection)
+
+    def _on_source_changed(self, prop, value):
+        if not prop:
+            self._sync()
+        else:
+            self._set_collection(value)
+
+    def _set_collection(self, collection):
+        if collection is not self._collection:
+            for signal, slot in self._connections:
+                signal.disconnect(slot)
+            self._connections = ()
+            self._collection = collection
+            if hasattr(collection, 'rowsInserted'):
+                self._connections = (
+                    (collection.rowsInserted, self._on_rows_inserted),
+                    (collection.rowsRemoved, self._on_rows_removed),
+                    (collection.rowsMoved, self._on_rows_moved),
+                    (collection.dataChanged, self._on_data_changed),
+                    (collection.modelReset, self._on_reset),
+                    (collection.layoutChanged, self._on_reset),
+                )
+                for signal, slot in self._connections:
+                    signal.connect(slot)
+        self._run(self._replace_all)
+
+    def _run(self, func, *args):
+        if self._items is None:
+            return
+        if self._stats is not None:
+            self._stats.run(READ, func, *args)
+        else:
+            func(*args)
+
+    def _text(self, row):
+        collection = self._collection
+        if self._display is not None:
+            return self._display(collection[row])
+        if hasattr(collection, 'rowsInserted'):
+            text = collection.data(collection.index(row, 0), Qt.DisplayRole)
+            return '' if text is None else str(text)
+        return str(collection[row])
+
+    def _replace_all(self):
+        """
+        Apply the difference between displayed items and the collection: the changed middle part is replaced
+        """
+        collection = self._collection
+        count = 0
+        if collection is not None:
+            count = collection.rowCount(QModelIndex()) if hasattr(collection, 'rowsInserted') else len(collection)
+        texts = [self._text(row) for row in range(count)]
+        old = self._texts
+        prefix = 0
+        limit = min(len(old), len(texts))
+        while prefix < limit and old[prefix] == texts[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == texts[-1 - suffix]:
+            suffix += 1
+        removed = len(old) - prefix - suffix
+        added = texts[prefix:len(texts) - suffix]
+
+        # texts replaced in place keep their rows (and the current item)
+        common = min(removed, len(added))
+        for i in range(common):
+            self._items.set_text(prefix + i, added[i])
+        if removed > common:
+            self._items.remove(prefix + common, removed - common)
+        elif len(added) > common:
+            self._items.insert(prefix + common, added[common:])
+        self._texts = texts
+
+    def _on_rows_inserted(self, parent, first, last):
+        self._run(self._insert_rows, first, last)
+
+    def _insert_rows(self, first, last):
+        texts = [self._text(row) for row in range(first, last + 1)]
+        self._items.insert(first, texts)
+        self._texts[first:first] = texts
+
+    def _on_rows_removed(self, parent, first, last):
+        self._run(self._remove_rows, first, last)
+
+    def _remove_rows(self, first, last):
+        self._items.remove(first, last - first + 1)
+        del self._texts[first:last + 1]
+
+    def _on_rows_moved(self, parent, start, end, destination, row):
+        self._run(self._move_rows, start, end, row)
+
+    def _move_rows(self, start, end, row):
+        count = end - start + 1
+        insert_at = row - count if row > end else row
+        current = self._items.current()
+        if start <= current <= end:
+            new_current = insert_at + current - start
+        else:
+            new_current = current - count if current > end else current
+            if new_current >= insert_at and current >= 0:
+                new_current += count
+
+        # rewrite the texts of the affected rows in place instead of removing and re-inserting them,
+        # so the current item does not pass through intermediate positions
+        old = self._texts
+        texts = old[:start] + old[end + 1:]
+        texts[insert_at:insert_at] = old[start:end + 1]
+        for i in range(min(start, insert_at), max(end, insert_at + count - 1) + 1):
+            if texts[i] != old[i]:
+                self._items.set_text(i, texts[i])
+        self._texts = texts
+        if self._items.current() != new_current:
+            self._items.set_current(new_current)
+
+    def _on_data_changed(self, top_left, bottom_right, roles):
+        self._run(self._update_rows, top_left.row(), bottom_right.row())
+
+    def _update_rows(self, first, last):
+        for row in range(first, last + 1):
+            text = self._text(row)
+            if text != self._texts[row]:
+                self._items.set_text(row, text)
+                self._texts[row] = text
+
+    def _on_reset(self, *args):
+        self._run(self._replace_all)
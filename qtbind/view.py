@@ -1,41 +1,329 @@
-from PyQt5.QtCore import pyqtProperty
-from qtbind.qtbind import Binding, BIND_READ, BIND_WRITE
+from PyQt5.QtCore import QEvent, QObject, QTimer, pyqtProperty
+from qtbind.interfaces import IPropertyChanged, property_dispatcher
+from qtbind.profiling import FanoutStats, STORM_THRESHOLD, STORM_WINDOW_MS, format_report
+from qtbind.qtbind import Binding, BindingTemplate, CollectionBinding, BIND_READ, BIND_WRITE
+
+
+def find_view(widget):
+    """
+    Find the closest View in the widget's parent chain (including the widget itself)
+    :return: View or None
+    """
+    while widget is not None and not isinstance(widget, View):
+        widget = widget.parent()
+    return widget
+
+
+_NO_CONTEXT = object()
+
+
+class ShowSyncFilter(QObject):
+    """
+    Event filter that synchronizes deferred bindings of a hidden widget when it is shown
+    """
+    def __init__(self):
+        super().__init__()
+        self._bindings = {}
+
+    def defer(self, widget, binding):
+        """
+        Synchronize binding once widget is shown
+        """
+        bindings = self._bindings.get(widget)
+        if bindings is None:
+            bindings = self._bindings[widget] = []
+            widget.installEventFilter(self)
+        if binding not in bindings:
+            bindings.append(binding)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Show:
+            bindings = self._bindings.get(obj)
+            if bindings is not None:
+                self._release(obj)
+                for binding in bindings:
+                    binding.sync()
+        return False
+
+    def _release(self, widget):
+        del self._bindings[widget]
+        widget.removeEventFilter(self)
+
+
+class BindingSpec:
+    """
+    Declarative binding of a context property to a widget stored in a View attribute.
+    Used in View.bindings class attribute.
+    """
+    OPTIONS = ('debounce_ms', 'throttle_ms', 'source_throttle_ms', 'skip_equal', 'comparator',
+               'executor', 'getter', 'placeholder')
+
+    __slots__ = ('prop_name', 'widget', 'wdg_prop', 'flags', 'target_signal', 'options')
+
+    def __init__(self, prop_name, widget, wdg_prop, flags=(BIND_READ | BIND_WRITE), target_signal=None, **options):
+        """
+        Same arguments as View.bind(), except that widget is the name of the View attribute holding the widget
+        """
+        for name, val in (('prop_name', prop_name), ('widget', widget), ('wdg_prop', wdg_prop)):
+            if not isinstance(val, str) or not val:
+                raise TypeError("BindingSpec.%s must be a non-empty string, got %r" % (name, val))
+        if not flags or flags & ~(BIND_READ | BIND_WRITE):
+            raise ValueError("invalid binding flags %r" % (flags,))
+        unknown = set(options) - set(self.OPTIONS)
+        if unknown:
+            raise TypeError("unknown binding options: " + ", ".join(sorted(unknown)))
+
+        self.prop_name = prop_name
+        self.widget = widget
+        self.wdg_prop = wdg_prop
+        self.flags = flags
+        self.target_signal = target_signal
+        self.options = options
 
 
 class View:
+    """
+    Manages bindings of child widget properties to context properties.
+    Bindings can be created with bind() or declared once per class:
+        class PersonView(QWidget, View):
+            bindings = (
+                BindingSpec("name", "_name", "text"),
+                ("family_name", "_family_name", "text"),  # BindingSpec arguments
+            )
+    Declared bindings are validated and compiled into a binding plan on first use; instances create them with
+    bind_declared() once their widgets exist.
+
+    Switching context re-points all bindings in one pass and skips widget writes that would not change the
+    displayed value. Class options:
+    defer_hidden_sync - widgets that are hidden during a context switch are synchronized when they are shown
+    coalesce_context_changes - context assignments are applied once per event loop iteration (last one wins)
+    """
+    # class-level binding declarations: sequence of BindingSpec or BindingSpec argument tuples
+    bindings = ()
+
+    defer_hidden_sync = False
+    coalesce_context_changes = False
+
     def __init__(self, context=None):
         self._context = None
         self._bindings = []
-        self.context = context
+        self._pending_context = _NO_CONTEXT
+        self._context_timer = None
+        self._show_filter = None
+        self._profiling = None
+        self._fanout = None
+        self._set_context(context)
 
     @pyqtProperty(object)
     def context(self):
+        if self._pending_context is not _NO_CONTEXT:
+            return self._pending_context
         return self._context
 
     @context.setter
     def context(self, val):
+        if not self.coalesce_context_changes:
+            self._set_context(val)
+            return
+        self._pending_context = val
+        if self._context_timer is None:
+            self._context_timer = QTimer()
+            self._context_timer.setSingleShot(True)
+            self._context_timer.timeout.connect(self.flush_context)
+        if not self._context_timer.isActive():
+            self._context_timer.start(0)
+
+    def flush_context(self):
+        """
+        Apply pending (coalesced) context change immediately
+        """
+        if self._context_timer is not None:
+            self._context_timer.stop()
+        val, self._pending_context = self._pending_context, _NO_CONTEXT
+        if val is not _NO_CONTEXT:
+            self._set_context(val)
+
+    def _set_context(self, val):
+        self._pending_context = _NO_CONTEXT
         if val == self._context:
             return
         old = self._context
+        if isinstance(old, IPropertyChanged):
+            old.batch_committed.disconnect(self._on_context_batch_committed)
         self._context = val
+        if isinstance(val, IPropertyChanged):
+            val.batch_committed.connect(self._on_context_batch_committed)
+        if self._fanout is not None:
+            self._watch_fanout(old, self._fanout, False)
+            self._watch_fanout(val, self._fanout, True)
         self._update_bindings()
         self._on_context_changed(old, val)
 
-    def bind(self, prop_name, wdg, wdg_prop, flags=(BIND_READ | BIND_WRITE), target_signal=None):
+    def bind(self, prop_name, wdg, wdg_prop, flags=(BIND_READ | BIND_WRITE), target_signal=None,
+             debounce_ms=None, throttle_ms=None, source_throttle_ms=None, skip_equal=False, comparator=None,
+             executor=None, getter=None, placeholder=None):
         """
         Bind context property to widget property
         :param prop_name: context property
         :param wdg: QWidget
         :param wdg_prop: property name
+        :param debounce_ms: write widget value to context only after it stops changing for given time
+        :param throttle_ms: write widget value to context at most once per given time
+        :param source_throttle_ms: update widget from context at most once per given time
+        :param skip_equal: skip writes of values equal to the last value exchanged in that direction
+        :param comparator: callable(a, b) -> bool replacing == for skip_equal (e.g. float tolerance)
+        :param executor: read the context property on this concurrent.futures.Executor instead of the GUI thread
+                         (True for a shared thread pool); results of superseded reads are dropped
+        :param getter: asynchronous mode: callable(context) or coroutine function producing the value
+        :param placeholder: asynchronous mode: widget value shown until the value is ready
         """
         binding = Binding(source=self._context, source_prop=prop_name,
                           target=wdg, target_prop=wdg_prop, flags=flags,
-                          target_signal=target_signal)
+                          target_signal=target_signal,
+                          debounce_ms=debounce_ms, throttle_ms=throttle_ms,
+                          source_throttle_ms=source_throttle_ms,
+                          skip_equal=skip_equal, comparator=comparator,
+                          executor=executor, getter=getter, placeholder=placeholder)
+        if self._profiling is not None:
+            binding.enable_profiling(**self._profiling)
+        self._bindings.append(binding)
+
+    def bind_items(self, prop_name, wdg, display=None):
+        """
+        Bind items of QComboBox or QListWidget to a context property holding a list or list model.
+        Changes of the list are applied to the widget incrementally, keeping its current item.
+        :param prop_name: context property
+        :param wdg: QComboBox or QListWidget
+        :param display: callable(item) -> str producing item text
+        """
+        binding = CollectionBinding(source=self._context, source_prop=prop_name, target=wdg, display=display)
+        if self._profiling is not None:
+            binding.enable_profiling(**self._profiling)
         self._bindings.append(binding)
 
+    @classmethod
+    def binding_plan(cls):
+        """
+        Binding plan of the class: tuple of (widget attribute, BindingTemplate).
+        Compiled once per class from its bindings attribute, which overrides the bindings of the bases like any
+        class attribute (extend them with bindings = Base.bindings + (...)). The templates are shared by all
+        instances, so each instance only supplies its widgets and context. What remains per instance is mostly Qt
+        work (connecting the widget's notify signal and showing the initial value).
+        """
+        plan = cls.__dict__.get('_binding_plan')
+        if plan is not None:
+            return plan
+
+        plan = []
+        targets = set()
+        for spec in cls.bindings:
+            if not isinstance(spec, BindingSpec):
+                spec = BindingSpec(*spec)
+            target = (spec.widget, spec.wdg_prop)
+            if target in targets:
+                raise ValueError("%s.bindings binds %s.%s more than once" % ((cls.__name__,) + target))
+            targets.add(target)
+            template = BindingTemplate(spec.prop_name, spec.wdg_prop, flags=spec.flags,
+                                       target_signal=spec.target_signal, **spec.options)
+            plan.append((spec.widget, template))
+        plan = tuple(plan)
+        cls._binding_plan = plan
+        return plan
+
+    def bind_declared(self):
+        """
+        Create bindings declared in the class bindings attribute. Call after the widgets are created.
+        """
+        context = self._context
+        dispatcher = property_dispatcher(context) if context is not None else None
+        bindings = self._bindings
+        for widget_attr, template in self.binding_plan():
+            try:
+                widget = getattr(self, widget_attr)
+            except AttributeError:
+                raise AttributeError("%s has no widget attribute %r declared in bindings"
+                                     % (type(self).__name__, widget_attr)) from None
+            binding = template.create(context, widget, dispatcher)
+            if self._profiling is not None:
+                binding.enable_profiling(**self._profiling)
+            bindings.append(binding)
+
+    def skipped_updates(self):
+        """
+        Total number of redundant writes skipped by equality-aware bindings of this view
+        """
+        return sum(binding.skipped_updates for binding in self._bindings)
+
+    def enable_profiling(self, storm_threshold=STORM_THRESHOLD, storm_window_ms=STORM_WINDOW_MS, on_alert=None):
+        """
+        Record update counts and timings of all bindings of this view (including bindings created later)
+        and fan-out of the context's property change notifications
+        :param storm_threshold: flag a storm when a binding updates more than this many times within storm_window_ms
+        :param on_alert: optional callable(BindingStats, kind) called when a loop or storm is detected
+        """
+        self._profiling = dict(storm_threshold=storm_threshold, storm_window_ms=storm_window_ms, on_alert=on_alert)
+        for binding in self._bindings:
+            binding.enable_profiling(**self._profiling)
+        if self._fanout is None:
+            self._fanout = FanoutStats()
+            self._watch_fanout(self._context, self._fanout, True)
+
+    def disable_profiling(self):
+        """
+        Stop recording statistics and drop them
+        """
+        self._profiling = None
+        for binding in self._bindings:
+            binding.disable_profiling()
+        if self._fanout is not None:
+            self._watch_fanout(self._context, self._fanout, False)
+            self._fanout = None
+
+    def binding_stats(self):
+        """
+        Statistics of profiled bindings: list of dicts (see qtbind.profiling.BindingStats.as_dict())
+        """
+        return [binding.stats.as_dict() for binding in self._bindings if binding.stats is not None]
+
+    def fanout_stats(self):
+        """
+        Fan-out of the context's property change notifications: prop_name -> dict of notifications, mean and max fan-out
+        """
+        return self._fanout.as_dict() if self._fanout is not None else {}
+
+    def profiling_report(self, sort_by='time_ms', limit=None):
+        """
+        Binding statistics as a text table sorted by given column, followed by notification fan-out
+        """
+        lines = [format_report(self.binding_stats(), sort_by, limit), '', 'notifications  fan-out  max  property']
+        for prop_name, fanout in sorted(self.fanout_stats().items(), key=lambda item: -item[1]['notifications']):
+            lines.append('%13d  %7.1f  %3d  %s' % (fanout['notifications'], fanout['mean_fanout'],
+                                                   fanout['max_fanout'], prop_name))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _watch_fanout(context, stats, watch):
+        if context is not None and hasattr(context, 'property_changed'):
+            dispatcher = property_dispatcher(context)
+            if watch:
+                dispatcher.add_stats(stats)
+            else:
+                dispatcher.remove_stats(stats)
+
     def _update_bindings(self):
+        context = self._context
+        dispatcher = property_dispatcher(context) if context is not None else None
+        defer_hidden = self.defer_hidden_sync
+
         for binding in self._bindings:
-            binding.source = self._context
+            binding.set_source(context, dispatcher, sync=False)
+            target = binding.target
+            if defer_hidden and target is not None and hasattr(target, 'isVisible') and not target.isVisible():
+                if self._show_filter is None:
+                    self._show_filter = ShowSyncFilter()
+                self._show_filter.defer(target, binding)
+            else:
+                binding.sync()
 
     def _on_context_changed(self, old, new):
         """
@@ -44,3 +332,10 @@ class View:
         :param new: new context value
         """
         pass
+
+    def _on_context_batch_committed(self, prop_names):
+        """
+        Called once after a batch update on the context is committed
+        :param prop_names: tuple of changed property names
+        """
+        pass
@@ -1,6 +1,12 @@
-from PyQt5.QtCore import QAbstractListModel, QModelIndex
+import array
+import bisect
+import threading
+import weakref
+from collections import OrderedDict
 
-from qtbind.interfaces import IPropertyChanged, Event
+from PyQt5.QtCore import QAbstractItemModel, QAbstractListModel, QAbstractTableModel, QModelIndex, QTimer, Qt
+
+from qtbind.interfaces import IPropertyChanged, Event, property_dispatcher
 
 
 class ViewModel(IPropertyChanged):
@@ -22,7 +28,7 @@ class ViewModel(IPropertyChanged):
             return
 
         self._model = val
-        self.property_changed.emit(None, None)
+        self.notify_property_changed(None, None)
 
 
 class ViewModelProperty:
@@ -34,17 +40,206 @@ class ViewModelProperty:
         self._prop_name = prop_name
 
     def __get__(self, instance, type=None):
+        frames = _tracking.frames
+        if frames:
+            frames[-1][(id(instance), self._prop_name)] = instance
         return getattr(instance.model, self._prop_name)
 
     def __set__(self, instance, value):
-        if value != getattr(instance.model, self._prop_name):
-            setattr(instance.model, self._prop_name, value)
-            instance.property_changed.emit(self._prop_name, value)
+        model = instance.model
+        if value != getattr(model, self._prop_name):
+            setattr(model, self._prop_name, value)
+            instance.notify_property_changed(self._prop_name, value)
         return value
 
     def __delete__(self, instance):
         delattr(instance.model, self._prop_name)
-        instance.property_changed.emit(self._prop_name, None)
+        instance.notify_property_changed(self._prop_name, None)
+
+
+class _DependencyTracking(threading.local):
+    """
+    Per-thread stack of dependencies recorded by computed properties being evaluated: (id(obj), prop_name) -> obj.
+    Per thread, so that reads made on other threads (e.g. by asynchronous bindings) are not recorded into
+    a computed property being evaluated in the GUI thread.
+    """
+    def __init__(self):
+        self.frames = []
+
+
+_tracking = _DependencyTracking()
+
+
+class computed:
+    """
+    Memoized derived property of a view model.
+    Reads of ViewModelProperty and computed properties (of any view model) made while the getter runs are recorded
+    as its dependencies. The value is cached until one of them changes; then it is recomputed and a change
+    notification is emitted if the value differs.
+    Properties that are not tracked automatically (e.g. plain Python properties notified by hand) can be listed
+    in depends_on.
+    Usage example:
+        class PersonViewModel(ViewModel):
+            @computed
+            def display_name(self):
+                return self.family_name + ", " + self.name
+
+            @computed(depends_on=('current',))
+            def current_name(self):
+                return self.current.name if self.current else ""
+    """
+    def __init__(self, getter=None, depends_on=()):
+        """
+        :param getter: function computing the value from the view model
+        :param depends_on: names of additional properties of the view model the value depends on
+        """
+        self._getter = None
+        self._name = None
+        self._depends_on = tuple(depends_on)
+        if getter is not None:
+            self(getter)
+
+    def __call__(self, getter):
+        self._getter = getter
+        self._name = getter.__name__
+        self.__doc__ = getter.__doc__
+        return self
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, type=None):
+        if instance is None:
+            return self
+        frames = _tracking.frames
+        if frames:
+            frames[-1][(id(instance), self._name)] = instance
+        state = self._state(instance)
+        if not state.valid:
+            state.evaluate(instance)
+        return state.value
+
+    def __set__(self, instance, value):
+        raise AttributeError("computed property %r is read-only" % self._name)
+
+    def invalidate(self, instance):
+        """
+        Drop the cached value of instance; it is recomputed on next access
+        """
+        state = instance.__dict__.get('_computed_states', {}).get(self._name)
+        if state is not None:
+            state.valid = False
+
+    def _state(self, instance):
+        states = instance.__dict__.get('_computed_states')
+        if states is None:
+            states = instance.__dict__['_computed_states'] = {}
+        state = states.get(self._name)
+        if state is None:
+            state = states[self._name] = _ComputedState(self, instance)
+        return state
+
+
+class _ComputedState:
+    """
+    Cached value and dependency subscriptions of one computed property of one instance.
+    The instance and the owners of its dependencies are referenced weakly: subscriptions to longer-lived objects
+    do not keep the instance alive, and they are dropped once the instance is collected.
+    """
+    __slots__ = ('_descriptor', '_instance', 'value', 'valid', '_dependencies', '__weakref__')
+
+    def __init__(self, descriptor, instance):
+        self._descriptor = descriptor
+        self._instance = weakref.ref(instance, self._on_collected)
+        self.value = None
+        self.valid = False
+        self._dependencies = {}  # (id(owner), prop_name) -> weak reference to owner
+
+    def evaluate(self, instance):
+        descriptor = self._descriptor
+        frame = {}
+        frames = _tracking.frames
+        frames.append(frame)
+        try:
+            value = descriptor._getter(instance)
+        finally:
+            frames.pop()
+        for name in descriptor._depends_on:
+            frame[(id(instance), name)] = instance
+        self._update_subscriptions(frame)
+        self.value = value
+        self.valid = True
+        return value
+
+    def _update_subscriptions(self, dependencies):
+        """
+        Subscribe to dependencies (key -> owner) not subscribed yet, unsubscribe from the ones no longer used
+        """
+        old = self._dependencies
+        for key, ref in old.items():
+            owner = ref()
+            if owner is not None and dependencies.get(key) is not owner:
+                property_dispatcher(owner).unsubscribe(key[1], self._on_dependency_changed)
+
+        refs = {}
+        for key, owner in dependencies.items():
+            if not hasattr(owner, 'property_changed'):
+                continue
+            ref = old.get(key)
+            if ref is None or ref() is not owner:
+                property_dispatcher(owner).subscribe(key[1], self._on_dependency_changed)
+                ref = weakref.ref(owner)
+            refs[key] = ref
+        self._dependencies = refs
+
+    def _on_dependency_changed(self, prop, value):
+        instance = self._instance()
+        if instance is None or not self.valid:
+            return
+        old = self.value
+        self.valid = False
+        value = self.evaluate(instance)
+        if value is old or value == old:
+            return
+        name = self._descriptor._name
+        if isinstance(instance, IPropertyChanged):
+            instance.notify_property_changed(name, value)
+        else:
+            instance.property_changed.emit(name, value)
+
+    def _on_collected(self, ref):
+        self.valid = False
+        self.value = None
+        self._update_subscriptions({})
+
+
+def _longest_increasing_subsequence(values):
+    """
+    Indices of the longest strictly increasing subsequence of values (O(n log n))
+    """
+    tails = []
+    tail_indices = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        pos = bisect.bisect_left(tails, value)
+        if pos == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[pos] = value
+            tail_indices[pos] = i
+        previous[i] = tail_indices[pos - 1] if pos > 0 else -1
+
+    result = []
+    i = tail_indices[-1] if tail_indices else -1
+    while i >= 0:
+        result.append(i)
+        i = previous[i]
+    result.reverse()
+    return result
+
+
+_MISSING = object()
 
 
 class IContainerViewModel:
@@ -57,82 +252,1410 @@ class IContainerViewModel:
         self.item_property_changed = Event()
 
 
-class ListViewModel(QAbstractListModel, ViewModel, IContainerViewModel):
+class ItemSubscription:
+    """
+    Connection of a container view model to one of its items.
+    The container is referenced weakly, so items that outlive it do not keep it alive.
+    """
+    __slots__ = ('_owner', 'item', '_connection', '__weakref__')
+
+    def __init__(self, owner, item):
+        self._owner = weakref.ref(owner)
+        self.item = item
+        self._connection = item.property_changed.connect(self)
+
+    def __call__(self, prop, val):
+        owner = self._owner()
+        if owner is None:
+            self.disconnect()
+            return
+        owner._on_item_property_changed(self.item, prop, val)
+
+    def disconnect(self):
+        if self._connection is not None:
+            self.item.property_changed.disconnect(self._connection)
+            self._connection = None
+
+
+class _ListViewModelBase(QAbstractListModel, ViewModel, IContainerViewModel):
+    """
+    Item change tracking, dataChanged coalescing and data caching shared by list view models.
+    Subclasses provide __getitem__(), __len__() and row_of().
+    """
+    def __init__(self, model, data_delegate=None, property_roles=None, cache_data=False):
+        super().__init__(model=model)
+        IContainerViewModel.__init__(self)
+
+        self._data_delegate = data_delegate
+        self._property_roles = {prop: frozenset(roles) for prop, roles in (property_roles or {}).items()}
+        self._subscriptions = {}
+        self._pending_changes = {}
+        self._flush_timer = None
+        self._data_cache = {} if cache_data else None
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def flush_changes(self):
+        """
+        Emit pending dataChanged notifications immediately
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        pending, self._pending_changes = self._pending_changes, {}
+
+        changes = []
+        for item, roles in pending.values():
+            row = self.row_of(item)
+            if row >= 0:
+                changes.append((row, roles))
+        changes.sort(key=lambda change: change[0])
+
+        # merge contiguous rows affected by the same roles
+        top = bottom = None
+        top_roles = None
+        for row, roles in changes:
+            if top is not None and row == bottom + 1 and roles == top_roles:
+                bottom = row
+                continue
+            if top is not None:
+                self._emit_data_changed(top, bottom, top_roles)
+            top = bottom = row
+            top_roles = roles
+        if top is not None:
+            self._emit_data_changed(top, bottom, top_roles)
+
+    def data(self, index, role):
+        """
+        Overrides QAbstractListModel
+        """
+        if not index.isValid() or self._data_delegate is None:
+            return None
+        return self._item_data(self[index.row()], role)
+
+    def cache_stats(self):
+        """
+        Data cache statistics: dict with hits, misses and number of cached items
+        """
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'items': len(self._data_cache) if self._data_cache is not None else 0,
+        }
+
+    def clear_data_cache(self):
+        """
+        Drop all cached data values
+        """
+        if self._data_cache is not None:
+            self._data_cache.clear()
+
+    def rowCount(self, parent):
+        return 0 if parent.isValid() else len(self)
+
+    def _item_data(self, obj, role):
+        """
+        Render item data through data_delegate, using the data cache when enabled
+        """
+        cache = self._data_cache
+        if cache is None:
+            return self._data_delegate(obj, role)
+
+        values = cache.get(id(obj))
+        if values is None:
+            values = cache[id(obj)] = {}
+        else:
+            value = values.get(role, _MISSING)
+            if value is not _MISSING:
+                self._cache_hits += 1
+                return value
+        self._cache_misses += 1
+        value = values[role] = self._data_delegate(obj, role)
+        return value
+
+    def _invalidate_data(self, item, roles=None):
+        """
+        Drop cached data of the item for given roles (all roles when empty)
+        """
+        if self._data_cache is None:
+            return
+        if not roles:
+            self._data_cache.pop(id(item), None)
+            return
+        values = self._data_cache.get(id(item))
+        if values is not None:
+            for role in roles:
+                values.pop(role, None)
+
+    def _subscribe(self, item):
+        """
+        Register for change notifications of the item (items are distinct objects)
+        """
+        if isinstance(item, IPropertyChanged):
+            self._subscriptions[id(item)] = ItemSubscription(self, item)
+
+    def _unsubscribe(self, item):
+        subscription = self._subscriptions.pop(id(item), None)
+        if subscription is not None:
+            subscription.disconnect()
+
+    def _emit_data_changed(self, top, bottom, roles):
+        self.dataChanged.emit(self.index(top, 0), self.index(bottom, 0), sorted(roles) if roles else [])
+
+    def _schedule_flush(self):
+        if self._flush_timer is None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.timeout.connect(self.flush_changes)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(0)
+
+    def _on_item_property_changed(self, item, prop, val):
+        """
+        Called when one of the item's properties changes
+        """
+        # empty set means all roles
+        roles = self._property_roles.get(prop, frozenset()) if prop else frozenset()
+        self._invalidate_data(item, roles)
+        key = id(item)
+        pending = self._pending_changes.get(key)
+        if pending is None:
+            self._pending_changes[key] = (item, roles)
+        elif pending[1] and roles:
+            self._pending_changes[key] = (item, pending[1] | roles)
+        else:
+            self._pending_changes[key] = (item, frozenset())
+        self._schedule_flush()
+        self.item_property_changed.emit(item, prop, val)
+
+
+class ListViewModel(_ListViewModelBase):
     """
-    View model for wrapping lists
+    View model for wrapping lists.
+    Items must be distinct objects: rows are looked up through an item -> row index.
+    The wrapped model list is kept in the same order as the view model items.
+    Item changes are collected and emitted as merged dataChanged ranges once per event loop iteration.
     """
-    def __init__(self, model, init=None, data_delegate=None):
+    def __init__(self, model, init=None, data_delegate=None, property_roles=None, cache_data=False):
         """
         Wrap a list of VM objects
         :param model: list
         :param data_delegate: actual implementation responsible for rendering data
                               unfortunately, Qt VM implementation is not really a VM as it doesn't reuse
                               the model for different views. Here, we attempt to do so.
+        :param property_roles: optional dict of item property name -> roles affected by its change.
+                               Properties that are not listed affect all roles.
+        :param cache_data: cache data_delegate results per (item, role) until the item changes.
+                           Only roles listed in property_roles for the changed property are invalidated.
         """
-        super().__init__(model=model)
-        IContainerViewModel.__init__(self)
+        super().__init__(model, data_delegate=data_delegate, property_roles=property_roles, cache_data=cache_data)
 
         self._list = init if init is not None else []
-        self._data_delegate = data_delegate
+        self._rows = {}  # id(item) -> (row, number of row shifts already applied to it)
+        self._shifts = []  # (row, delta): rows from row on moved by delta, applied on lookup
 
-        if len(self._list):
-            for item in self._list:
-                if isinstance(item, IPropertyChanged):
-                    item.property_changed.connect(lambda x, y: self._on_item_property_changed(item, x, y))
+        for item in self._list:
+            self._subscribe(item)
+        self._rebuild_rows()
 
     def append(self, obj):
-        index = self.index(len(self._list), 0)
-        self.beginInsertRows(index, index)
-        self._list.append(obj)
-        self._model.append(obj.model)
-        if isinstance(obj, IPropertyChanged):
-            obj.property_changed.connect(lambda x, y: self._on_item_property_changed(obj, x, y))
-        self.endInsertRows()
+        self._insert_items(len(self._list), [obj])
+
+    def extend(self, objs):
+        """
+        Append several items with a single insert notification
+        """
+        self._insert_items(len(self._list), list(objs))
+
+    def insert(self, row, obj):
+        """
+        Insert item before given row
+        """
+        self._insert_items(min(max(row, 0), len(self._list)), [obj])
 
     def remove(self, obj):
-        try:
-            index = self._list.index(obj)
-        except ValueError:
+        row = self.row_of(obj)
+        if row < 0:
+            return
+        self._remove_rows(row, 1)
+
+    def remove_range(self, row, count):
+        """
+        Remove count items starting at row with a single remove notification
+        """
+        row = max(row, 0)
+        count = min(count, len(self._list) - row)
+        if count > 0:
+            self._remove_rows(row, count)
+
+    def move(self, row, dest, count=1):
+        """
+        Move count items starting at row before the item at dest (dest is in pre-move coordinates).
+        """
+        if count <= 0 or row < 0 or row + count > len(self._list) or dest < 0 or dest > len(self._list):
+            raise IndexError("invalid move of rows %d..%d to %d" % (row, row + count - 1, dest))
+        if row <= dest <= row + count:
+            return
+        self._move_rows(row, count, dest)
+
+    def replace(self, new_items, key=None):
+        """
+        Replace list content with new_items using the minimal set of remove/move/insert notifications,
+        so that attached views keep their selection and scroll position.
+        :param new_items: iterable of items
+        :param key: function returning item identity key (default: object identity).
+                    Old items whose key matches a new item are replaced in place with dataChanged.
+        """
+        key = key if key is not None else id
+        new_items = list(new_items)
+        new_keys = [key(item) for item in new_items]
+        new_positions = {k: i for i, k in enumerate(new_keys)}
+        if len(new_positions) != len(new_keys):
+            raise ValueError("replace() requires unique item keys")
+
+        # remove old items missing from the new list (contiguous runs, from the end)
+        old_keys = [key(item) for item in self._list]
+        row = len(old_keys) - 1
+        while row >= 0:
+            if old_keys[row] in new_positions:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and old_keys[row] not in new_positions:
+                row -= 1
+            self._remove_rows(row + 1, last - row)
+
+        # keep the longest run of items already in the right relative order, move the rest
+        # right after their predecessor in the new order
+        current = {key(item): item for item in self._list}
+        old_order = [new_positions[k] for k in (key(item) for item in self._list)]
+        stable = {old_order[i] for i in _longest_increasing_subsequence(old_order)}
+        previous = None
+        for new_row, item_key in enumerate(new_keys):
+            existing = current.get(item_key)
+            if existing is None:
+                continue
+            if new_row not in stable:
+                row = self.row_of(existing)
+                dest = self.row_of(previous) + 1 if previous is not None else 0
+                if dest != row and dest != row + 1:
+                    self._move_rows(row, 1, dest)
+            previous = existing
+
+        # insert runs of new items at their final positions
+        row = 0
+        while row < len(new_items):
+            if new_keys[row] in current:
+                row += 1
+                continue
+            last = row
+            while last < len(new_items) and new_keys[last] not in current:
+                last += 1
+            self._insert_items(row, new_items[row:last])
+            row = last
+
+        for row, item in enumerate(new_items):
+            if self._list[row] is not item:
+                self._replace_item(row, item)
+
+    def _insert_items(self, row, objs):
+        if not objs:
             return
-        self.beginRemoveRows(QModelIndex(), index, index)
-        self._list.remove(obj)
-        self._model.remove(obj.model)
-        if isinstance(obj, IPropertyChanged):
-            obj.property_changed.disconnect(lambda x, y: self._on_item_property_changed(obj, x, y))
+        self.beginInsertRows(QModelIndex(), row, row + len(objs) - 1)
+        self._list[row:row] = objs
+        self._model[row:row] = [obj.model for obj in objs]
+        if row + len(objs) < len(self._list):
+            self._shift_rows((row, len(objs)))
+        rows = self._rows
+        applied = len(self._shifts)
+        for i, obj in enumerate(objs, row):
+            rows[id(obj)] = (i, applied)
+            self._subscribe(obj)
+        self.endInsertRows()
+
+    def _remove_rows(self, row, count):
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        removed = self._list[row:row + count]
+        del self._list[row:row + count]
+        del self._model[row:row + count]
+        for obj in removed:
+            del self._rows[id(obj)]
+            self._pending_changes.pop(id(obj), None)
+            self._unsubscribe(obj)
+            self._invalidate_data(obj)
+        if row < len(self._list):
+            self._shift_rows((row, -count))
         self.endRemoveRows()
 
+    def _move_rows(self, row, count, dest):
+        self.beginMoveRows(QModelIndex(), row, row + count - 1, QModelIndex(), dest)
+        insert_at = dest - count if dest > row else dest
+        moved = self._list[row:row + count]
+        for items in (self._list, self._model):
+            block = items[row:row + count]
+            del items[row:row + count]
+            items[insert_at:insert_at] = block
+        # the other rows shift as if the block was removed and inserted again; moved items get their new rows
+        self._shift_rows((row, -count), (insert_at, count))
+        rows = self._rows
+        applied = len(self._shifts)
+        for i, obj in enumerate(moved, insert_at):
+            rows[id(obj)] = (i, applied)
+        self.endMoveRows()
+
+    def _replace_item(self, row, obj):
+        old = self._list[row]
+        self._unsubscribe(old)
+        self._invalidate_data(old)
+        del self._rows[id(old)]
+        self._pending_changes.pop(id(old), None)
+        self._list[row] = obj
+        self._model[row] = obj.model
+        self._rows[id(obj)] = (row, len(self._shifts))
+        self._subscribe(obj)
+        self._emit_data_changed(row, row, None)
+
+    def row_of(self, obj):
+        """
+        Row of the item or -1 if it is not in the list
+        """
+        entry = self._rows.get(id(obj))
+        if entry is None:
+            return -1
+        row, applied = entry
+        shifts = self._shifts
+        if applied < len(shifts):
+            for start, delta in shifts[applied:]:
+                if row >= start:
+                    row += delta
+            self._rows[id(obj)] = (row, len(shifts))
+        return row
+
     def __getitem__(self, item):
         return self._list[item]
 
     def __len__(self):
         return len(self._list)
 
+    def _shift_rows(self, *shifts):
+        """
+        Record (row, delta) shifts: stored rows starting at row moved by delta.
+        Shifts are applied to an item when it is looked up; once there are more than sqrt(len) of them, all rows
+        are recomputed, so a structural change costs O(sqrt(n)) amortized instead of renumbering the rest of the list.
+        """
+        self._shifts.extend(shifts)
+        if len(self._shifts) ** 2 > len(self._list):
+            self._rebuild_rows()
+
+    def _rebuild_rows(self):
+        self._rows = {id(item): (row, 0) for row, item in enumerate(self._list)}
+        self._shifts = []
+
+
+class LazyListViewModel(_ListViewModelBase):
+    """
+    List view model that creates item view models on demand.
+    Wraps a list of model objects; item view models are created by factory when first accessed
+    (typically from data() for visible rows). The most recently used ones are kept alive in a bounded LRU cache.
+    An evicted item view model that is still referenced elsewhere stays connected and is returned again for its row,
+    so changes made through it keep updating the list; its subscription goes away once it is collected.
+    Rows can be loaded incrementally from a paged source through Qt's canFetchMore()/fetchMore().
+    """
+    def __init__(self, model, factory, data_delegate=None, property_roles=None, cache_data=False,
+                 cache_size=256, fetch_more=None, page_size=100):
+        """
+        :param model: list of model objects (modified in place by insert/remove/move and when more rows are fetched)
+        :param factory: callable creating item view model from model object
+        :param data_delegate: see ListViewModel
+        :param property_roles: see ListViewModel
+        :param cache_data: see ListViewModel (cached values are dropped with evicted item view models)
+        :param cache_size: maximum number of item view models kept alive
+        :param fetch_more: optional callable(offset, count) returning next page of model objects.
+                           A page shorter than count marks the source as exhausted.
+        :param page_size: number of rows requested per fetch
+        """
+        super().__init__(model, data_delegate=data_delegate, property_roles=property_roles, cache_data=cache_data)
+        # subscriptions are owned by the items' signals, so they do not keep evicted item view models alive
+        self._subscriptions = weakref.WeakValueDictionary()
+        self._factory = factory
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._items = weakref.WeakValueDictionary()  # row -> every live item view model created by the list
+        self._item_rows = {}
+        self._fetch_more = fetch_more
+        self._page_size = page_size
+        self._exhausted = fetch_more is None
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self._model)
+        item = self._cache.get(row)
+        if item is not None:
+            self._cache.move_to_end(row)
+            return item
+
+        item = self._items.get(row)
+        if item is None:
+            item = self._factory(self._model[row])
+            self._items[row] = item
+            self._item_rows[id(item)] = row
+            self._subscribe(item)
+            if len(self._item_rows) > 2 * len(self._items) + self._cache_size:
+                self._item_rows = {id(item): row for row, item in self._items.items()}
+        self._cache[row] = item
+        if len(self._cache) > self._cache_size:
+            self._evict(self._cache.popitem(last=False)[1])
+        return item
+
+    def __len__(self):
+        return len(self._model)
+
+    def row_of(self, obj):
+        """
+        Row of the item view model or -1 if it was not created by this list or its row was removed
+        """
+        row = self._item_rows.get(id(obj))
+        if row is None or self._items.get(row) is not obj:
+            return -1
+        return row
+
+    def append(self, obj):
+        """
+        Append model object
+        """
+        self.extend([obj])
+
+    def extend(self, objs):
+        """
+        Append model objects with a single insert notification
+        """
+        self._insert_rows(len(self._model), list(objs))
+
+    def insert(self, row, obj):
+        """
+        Insert model object before given row
+        """
+        self._insert_rows(min(max(row, 0), len(self._model)), [obj])
+
+    def remove(self, obj):
+        """
+        Remove model object
+        """
+        try:
+            row = self._model.index(obj)
+        except ValueError:
+            return
+        self.remove_range(row, 1)
+
+    def remove_range(self, row, count):
+        """
+        Remove count rows starting at row with a single remove notification
+        """
+        row = max(row, 0)
+        count = min(count, len(self._model) - row)
+        if count <= 0:
+            return
+        end = row + count
+        self.beginRemoveRows(QModelIndex(), row, end - 1)
+        del self._model[row:end]
+        self._renumber(lambda r: r if r < row else (r - count if r >= end else None))
+        self.endRemoveRows()
+
+    def move(self, row, dest, count=1):
+        """
+        Move count rows starting at row before the row at dest (dest is in pre-move coordinates).
+        """
+        size = len(self._model)
+        if count <= 0 or row < 0 or row + count > size or dest < 0 or dest > size:
+            raise IndexError("invalid move of rows %d..%d to %d" % (row, row + count - 1, dest))
+        if row <= dest <= row + count:
+            return
+        end = row + count
+        self.beginMoveRows(QModelIndex(), row, end - 1, QModelIndex(), dest)
+        moved = self._model[row:end]
+        del self._model[row:end]
+        if dest > row:
+            self._model[dest - count:dest - count] = moved
+            self._renumber(lambda r: r + dest - end if row <= r < end else (r - count if end <= r < dest else r))
+        else:
+            self._model[dest:dest] = moved
+            self._renumber(lambda r: r - row + dest if row <= r < end else (r + count if dest <= r < row else r))
+        self.endMoveRows()
+
+    def canFetchMore(self, parent):
+        """
+        Overrides QAbstractListModel
+        """
+        return not self._exhausted and not parent.isValid()
+
+    def fetchMore(self, parent):
+        """
+        Overrides QAbstractListModel: load next page from the paged source
+        """
+        if self._exhausted or parent.isValid():
+            return
+        page = list(self._fetch_more(len(self._model), self._page_size))
+        if len(page) < self._page_size:
+            self._exhausted = True
+        self.extend(page)
+
+    def _insert_rows(self, row, objs):
+        if not objs:
+            return
+        count = len(objs)
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        self._model[row:row] = objs
+        if row < len(self._model) - count:
+            self._renumber(lambda r: r + count if r >= row else r)
+        self.endInsertRows()
+
+    def _renumber(self, new_row):
+        """
+        Re-key item view models after a structural change
+        :param new_row: callable(row) -> new row, or None for a removed row
+        """
+        cache = OrderedDict()
+        for row, item in self._cache.items():
+            row = new_row(row)
+            if row is not None:
+                cache[row] = item
+        self._cache = cache
+
+        items = weakref.WeakValueDictionary()
+        for row, item in list(self._items.items()):
+            row = new_row(row)
+            if row is None:
+                self._release(item)
+            else:
+                items[row] = item
+                self._item_rows[id(item)] = row
+        self._items = items
+
+    def _evict(self, item):
+        # data is cached only for item view models in the LRU cache
+        self._invalidate_data(item)
+
+    def _release(self, item):
+        self._unsubscribe(item)
+        self._invalidate_data(item)
+        del self._item_rows[id(item)]
+        self._pending_changes.pop(id(item), None)
+
+
+class SortedFilteredListViewModel(QAbstractListModel, ViewModel):
+    """
+    Sorted and filtered view of a ListViewModel.
+    Included items are kept ordered by (key(item), source row); without key they keep the source order.
+    A row is located by binary search.
+    Driven by the source's item_property_changed: a changed item is re-evaluated alone and emitted as a single row
+    move, insert or remove. Source inserts/removals are applied incrementally, source moves re-sort the items
+    (as a layout change, only when the order of shown items changes); source dataChanged is forwarded to the
+    mapped rows.
+    """
+    def __init__(self, source, key=None, predicate=None, reverse=False, data_delegate=None,
+                 sort_properties=None, filter_properties=None):
+        """
+        :param source: ListViewModel to sort and filter
+        :param key: function returning the sort key of an item (default: source order)
+        :param predicate: function returning True for items that are shown (default: all items)
+        :param reverse: sort in descending order
+        :param data_delegate: data renderer (default: the source's data delegate and data cache)
+        :param sort_properties: names of item properties key depends on. Changes of other properties do not
+                                re-sort the item. Default: any change re-evaluates the key.
+        :param filter_properties: names of item properties predicate depends on (same as sort_properties)
+        """
+        super().__init__(model=source)
+        self._source = source
+        self._key = key
+        self._predicate = predicate
+        self._reverse = reverse
+        self._data_delegate = data_delegate
+        self._sort_properties = frozenset(sort_properties) if sort_properties is not None else None
+        self._filter_properties = frozenset(filter_properties) if filter_properties is not None else None
+        self._items = []  # included items ordered by (key, source row)
+        self._keys = {}  # id(item) -> sort key of included items
+        self._members = set()  # id(item) of every source item
+
+        source.item_property_changed.connect(self._on_item_property_changed, weak=True)
+        source.rowsInserted.connect(self._on_source_rows_inserted)
+        source.rowsAboutToBeRemoved.connect(self._on_source_rows_removed)
+        source.rowsMoved.connect(self._on_source_layout_changed)
+        source.layoutChanged.connect(self._on_source_layout_changed)
+        source.dataChanged.connect(self._on_source_data_changed)
+        source.modelReset.connect(self.invalidate)
+        self._rebuild()
+
+    def set_key(self, key, reverse=None):
+        """
+        Change the sort key (re-sorts all items)
+        """
+        self._key = key
+        if reverse is not None:
+            self._reverse = reverse
+        self.invalidate()
+
+    def set_predicate(self, predicate):
+        """
+        Change the filter predicate (re-filters all items)
+        """
+        self._predicate = predicate
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Re-evaluate key and predicate of all items, e.g. after external state used by them changed
+        """
+        self.beginResetModel()
+        self._rebuild()
+        self.endResetModel()
+
+    def row_of(self, obj):
+        """
+        Row of the item or -1 if it is not shown
+        """
+        key = self._keys.get(id(obj), _MISSING)
+        if key is _MISSING:
+            return -1
+        return self._row(self._bisect(key, self._source.row_of(obj)), len(self._items))
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self._items)
+        return self._items[self._row(row, len(self._items))]
+
+    def __len__(self):
+        return len(self._items)
+
+    def rowCount(self, parent):
+        return 0 if parent.isValid() else len(self._items)
+
     def data(self, index, role):
         """
         Overrides QAbstractListModel
         """
         if not index.isValid():
             return None
-
+        item = self[index.row()]
         if self._data_delegate is not None:
-            obj = self._list[index.row()]
-            res = self._data_delegate(obj, role)
-            if res is not None:
-                return res
-
+            return self._data_delegate(item, role)
+        if self._source._data_delegate is not None:
+            return self._source._item_data(item, role)
         return None
 
-    def rowCount(self, parent):
-        return len(self._list)
+    def _row(self, position, count):
+        """
+        Row of the sorted index position (translates between index positions and rows in reverse order)
+        """
+        return count - 1 - position if self._reverse else position
+
+    def _bisect(self, key, source_row):
+        """
+        Index position of the first included item not ordered before (key, source_row)
+        """
+        items = self._items
+        keys = self._keys
+        source_row_of = self._source.row_of
+        probe = (key, source_row)
+        low, high = 0, len(items)
+        while low < high:
+            mid = (low + high) // 2
+            item = items[mid]
+            if (keys[id(item)], source_row_of(item)) < probe:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _sort_key(self, item):
+        return self._key(item) if self._key is not None else None
+
+    def _included(self, item):
+        return self._predicate is None or bool(self._predicate(item))
+
+    def _rebuild(self):
+        source = self._source
+        self._members = {id(item) for item in source}
+        self._keys = {id(item): self._sort_key(item) for item in source if self._included(item)}
+        keys = self._keys
+        entries = [(keys[id(item)], row, item) for row, item in enumerate(source) if id(item) in keys]
+        entries.sort(key=lambda entry: entry[:2])
+        self._items = [item for _, _, item in entries]
+
+    def _insert(self, item, key):
+        position = self._bisect(key, self._source.row_of(item))
+        row = self._row(position, len(self._items) + 1)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.insert(position, item)
+        self._keys[id(item)] = key
+        self.endInsertRows()
+
+    def _remove(self, item, position):
+        row = self._row(position, len(self._items))
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._items[position]
+        del self._keys[id(item)]
+        self.endRemoveRows()
+
+    def _reposition(self, item, key, new_key):
+        source_row = self._source.row_of(item)
+        position = self._bisect(key, source_row)
+        new_position = self._bisect(new_key, source_row)
+        if new_position > position:
+            new_position -= 1
+        self._keys[id(item)] = new_key
+        if new_position == position:
+            return
+
+        items = self._items
+        row = self._row(position, len(items))
+        new_row = self._row(new_position, len(items))
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), new_row + 1 if new_row > row else new_row)
+        del items[position]
+        items.insert(new_position, item)
+        self.endMoveRows()
 
     def _on_item_property_changed(self, item, prop, val):
+        if id(item) not in self._members:
+            return
+        key = self._keys.get(id(item), _MISSING)
+        shown = key is not _MISSING
+        check_filter = self._predicate is not None and (
+            not prop or self._filter_properties is None or prop in self._filter_properties)
+        included = self._included(item) if check_filter else shown
+
+        if not included:
+            if shown:
+                self._remove(item, self._bisect(key, self._source.row_of(item)))
+            return
+        if not shown:
+            self._insert(item, self._sort_key(item))
+            return
+        if self._key is not None and (not prop or self._sort_properties is None or prop in self._sort_properties):
+            new_key = self._key(item)
+            if new_key != key:
+                self._reposition(item, key, new_key)
+
+    def _on_source_rows_inserted(self, parent, first, last):
+        for row in range(first, last + 1):
+            item = self._source[row]
+            self._members.add(id(item))
+            if self._included(item):
+                self._insert(item, self._sort_key(item))
+
+    def _on_source_rows_removed(self, parent, first, last):
+        for row in range(first, last + 1):
+            item = self._source[row]
+            self._members.discard(id(item))
+            key = self._keys.get(id(item), _MISSING)
+            if key is not _MISSING:
+                self._remove(item, self._bisect(key, row))
+
+    def _on_source_layout_changed(self, *args):
         """
-        Called when one of the item's properties changes
+        Source rows moved: re-sort the items whose order depends on source rows
+        """
+        keys = self._keys
+        source_row_of = self._source.row_of
+        items = sorted(self._items, key=lambda item: (keys[id(item)], source_row_of(item)))
+        if all(a is b for a, b in zip(items, self._items)):
+            return
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_items = [self[index.row()] for index in persistent]
+        self._items = items
+        self.changePersistentIndexList(persistent, [self.index(self.row_of(item), 0) for item in persistent_items])
+        self.layoutChanged.emit()
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles):
+        rows = []
+        for source_row in range(top_left.row(), bottom_right.row() + 1):
+            item = self._source[source_row]
+            if id(item) not in self._members:
+                # item replaced in place (ListViewModel.replace())
+                self._sync_replaced()
+                return
+            row = self.row_of(item)
+            if row >= 0:
+                rows.append(row)
+
+        rows.sort()
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                self.dataChanged.emit(self.index(rows[start], 0), self.index(rows[i - 1], 0), roles)
+                start = i
+
+    def _sync_replaced(self):
+        """
+        Drop items that are no longer in the source and add the new ones
+        """
+        current = {id(item): item for item in self._source}
+        for position in reversed(range(len(self._items))):
+            item = self._items[position]
+            if id(item) not in current:
+                self._remove(item, position)
+        self._members &= set(current)
+        for key, item in current.items():
+            if key not in self._members:
+                self._members.add(key)
+                if self._included(item):
+                    self._insert(item, self._sort_key(item))
+
+
+class _TreeNode:
+    """
+    Position of an item in TreeViewModel: parent node and row within it.
+    children is None until the children are loaded.
+    """
+    __slots__ = ('item', 'parent', 'row', 'children')
+
+    def __init__(self, item, parent, row):
+        self.item = item
+        self.parent = parent
+        self.row = row
+        self.children = None
+
+
+class TreeViewModel(QAbstractItemModel, ViewModel):
+    """
+    View model for hierarchies of IPropertyChanged items (e.g. groups -> people -> accounts).
+    Every item is wrapped in a node storing its parent and row, so index() and parent() are O(1).
+    Children are loaded on demand through Qt's canFetchMore()/fetchMore() when a node is expanded.
+    Item property changes are emitted as dataChanged of the item's node only.
+    Items must be distinct objects.
+    """
+    def __init__(self, model, children, has_children=None, data_delegate=None, property_roles=None):
+        """
+        :param model: list of root items
+        :param children: function(item) returning the child items; called once per item, when first expanded
+        :param has_children: optional function(item) -> bool telling whether an item that has not been expanded yet
+                             has children (e.g. a cheap count query). Default: assume it has.
+        :param data_delegate: function(item, role) rendering item data
+        :param property_roles: optional dict of item property name -> roles affected by its change
+                               (see ListViewModel)
+        """
+        super().__init__(model=model)
+        self._children = children
+        self._has_children = has_children
+        self._data_delegate = data_delegate
+        self._property_roles = {prop: sorted(roles) for prop, roles in (property_roles or {}).items()}
+        self._nodes = {}
+        self._subscriptions = {}
+        self._root = _TreeNode(None, None, 0)
+        self._root.children = []
+        self._check_new(model)
+        self._add_children(self._root, model)
+
+    def index_of(self, item):
+        """
+        Model index of the item (invalid index if the item is not loaded)
+        """
+        node = self._nodes.get(id(item))
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def item(self, index):
+        """
+        Item at the model index (None for the invisible root)
+        """
+        return self._node(index).item
+
+    def parent_of(self, item):
+        """
+        Parent item (None for root items)
+        """
+        return self._nodes[id(item)].parent.item
+
+    def loaded_children(self, item=None):
+        """
+        Children of the item (root items when item is None) or None if they have not been loaded yet
+        """
+        node = self._nodes[id(item)] if item is not None else self._root
+        return [child.item for child in node.children] if node.children is not None else None
+
+    def insert(self, parent, row, item):
+        """
+        Insert item under parent (None for root) before given row.
+        Ignored if the parent's children are not loaded yet (it is expected to be returned by children() then).
+        """
+        node = self._nodes[id(parent)] if parent is not None else self._root
+        if node.children is None:
+            return
+        self._check_new((item,))
+        row = min(max(row, 0), len(node.children))
+        self.beginInsertRows(self._index_of_node(node), row, row)
+        if node is self._root:
+            self._model.insert(row, item)
+        node.children.insert(row, self._add_node(item, node, row))
+        self._renumber(node, row + 1)
+        self.endInsertRows()
+
+    def append(self, parent, item):
+        """
+        Append item under parent (None for root)
+        """
+        node = self._nodes[id(parent)] if parent is not None else self._root
+        if node.children is not None:
+            self.insert(parent, len(node.children), item)
+
+    def remove(self, item):
+        """
+        Remove item and its subtree
+        """
+        node = self._nodes.get(id(item))
+        if node is None:
+            return
+        parent = node.parent
+        self.beginRemoveRows(self._index_of_node(parent), node.row, node.row)
+        del parent.children[node.row]
+        if parent is self._root:
+            del self._model[node.row]
+        self._release(node)
+        self._renumber(parent, node.row)
+        self.endRemoveRows()
+
+    def reload(self, item):
+        """
+        Drop loaded children of the item; they are loaded again by children() when the item is expanded
+        """
+        node = self._nodes[id(item)]
+        if not node.children:
+            node.children = None
+            return
+        self.beginRemoveRows(self._index_of_node(node), 0, len(node.children) - 1)
+        for child in node.children:
+            self._release(child)
+        # the node reports no rows (rather than unloaded children) until the removal is complete, so that views
+        # do not fetch the children again while handling rowsRemoved
+        node.children = []
+        self.endRemoveRows()
+        node.children = None
+
+    def index(self, row, column, parent=QModelIndex()):
+        """
+        Overrides QAbstractItemModel
+        """
+        node = self._node(parent)
+        if column != 0 or node.children is None or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index):
+        """
+        Overrides QAbstractItemModel
+        """
+        if not index.isValid():
+            return QModelIndex()
+        return self._index_of_node(index.internalPointer().parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        children = self._node(parent).children
+        return len(children) if children is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        """
+        Overrides QAbstractItemModel: does not load children
         """
+        node = self._node(parent)
+        if node.children is not None:
+            return bool(node.children)
+        return self._has_children(node.item) if self._has_children is not None else True
+
+    def canFetchMore(self, parent):
+        """
+        Overrides QAbstractItemModel
+        """
+        return self._node(parent).children is None
+
+    def fetchMore(self, parent):
+        """
+        Overrides QAbstractItemModel: load children of the node
+        """
+        node = self._node(parent)
+        if node.children is not None:
+            return
+        items = list(self._children(node.item))
+        self._check_new(items)
+        node.children = []
+        if items:
+            self.beginInsertRows(parent, 0, len(items) - 1)
+            self._add_children(node, items)
+            self.endInsertRows()
+
+    def data(self, index, role):
+        """
+        Overrides QAbstractItemModel
+        """
+        if not index.isValid() or self._data_delegate is None:
+            return None
+        return self._data_delegate(index.internalPointer().item, role)
+
+    def _node(self, index):
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _index_of_node(self, node):
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def _add_children(self, node, items):
+        node.children.extend(self._add_node(item, node, row) for row, item in enumerate(items, len(node.children)))
+
+    def _check_new(self, items):
+        """
+        Raise ValueError if any of the items is already in the tree or listed twice
+        (checked before the insert notification is started)
+        """
+        seen = set()
+        for item in items:
+            if id(item) in self._nodes or id(item) in seen:
+                raise ValueError("item %r is already in the tree" % (item,))
+            seen.add(id(item))
+
+    def _add_node(self, item, parent, row):
+        node = self._nodes[id(item)] = _TreeNode(item, parent, row)
+        if isinstance(item, IPropertyChanged):
+            self._subscriptions[id(item)] = ItemSubscription(self, item)
+        return node
+
+    def _release(self, node):
+        """
+        Forget node and its loaded subtree
+        """
+        del self._nodes[id(node.item)]
+        subscription = self._subscriptions.pop(id(node.item), None)
+        if subscription is not None:
+            subscription.disconnect()
+        for child in node.children or ():
+            self._release(child)
+
+    @staticmethod
+    def _renumber(node, start):
+        children = node.children
+        for row in range(start, len(children)):
+            children[row].row = row
+
+    def _on_item_property_changed(self, item, prop, val):
+        node = self._nodes.get(id(item))
+        if node is None:
+            return
+        index = self.createIndex(node.row, 0, node)
+        self.dataChanged.emit(index, index, self._property_roles.get(prop, []) if prop else [])
+
+
+_numpy_module = _MISSING
+
+
+def _numpy():
+    """
+    numpy module or None when it is not installed (imported on first use to keep qtbind imports fast)
+    """
+    global _numpy_module
+    if _numpy_module is _MISSING:
         try:
-            row = self._list.index(item)
-        except:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy_module = numpy
+    return _numpy_module
+
+
+def changed_rectangles(cells):
+    """
+    Merge changed cells into rectangles for dataChanged notifications.
+    Cells of a row are joined into runs of adjacent columns; identical runs of consecutive rows are joined
+    into one rectangle.
+    :param cells: iterable of (row, column)
+    :return: list of (top, left, bottom, right), sorted by top row
+    """
+    columns_by_row = {}
+    for row, col in cells:
+        columns_by_row.setdefault(row, set()).add(col)
+
+    rectangles = []
+    open_runs = {}  # (left, right) -> [top, bottom]
+    for row in sorted(columns_by_row):
+        cols = sorted(columns_by_row[row])
+        runs = []
+        left = right = cols[0]
+        for col in cols[1:]:
+            if col != right + 1:
+                runs.append((left, right))
+                left = col
+            right = col
+        runs.append((left, right))
+
+        still_open = {}
+        for run in runs:
+            rect = open_runs.pop(run, None)
+            if rect is not None and rect[1] == row - 1:
+                rect[1] = row
+            else:
+                if rect is not None:
+                    rectangles.append((rect[0], run[0], rect[1], run[1]))
+                rect = [row, row]
+            still_open[run] = rect
+        for run, rect in open_runs.items():
+            rectangles.append((rect[0], run[0], rect[1], run[1]))
+        open_runs = still_open
+    for run, rect in open_runs.items():
+        rectangles.append((rect[0], run[0], rect[1], run[1]))
+
+    rectangles.sort()
+    return rectangles
+
+
+class TableViewModel(QAbstractTableModel, ViewModel):
+    """
+    Multi-column view model with columnar storage.
+    Each column is stored in one NumPy array (when numpy is installed) or array module array, or a list
+    for columns of arbitrary Python objects, so bulk updates are slice/index assignments and data() is an array
+    lookup. DisplayRole text is produced per column by a vectorized formatter and cached; changed cells are
+    re-formatted in place. EditRole returns the raw value.
+    Batches of cell changes are emitted as merged dataChanged rectangles (see changed_rectangles()).
+    """
+    def __init__(self, columns, data=None, formats=None, headers=None, use_numpy=None):
+        """
+        :param columns: sequence of column names or (name, typecode) tuples. typecode is an array module type code
+                        ('d', 'q', ...); columns without one hold arbitrary Python objects
+        :param data: optional dict of column name -> initial values (all of the same length)
+        :param formats: optional dict of column name -> '%' format string, or callable(values) returning
+                        a sequence of strings for a sequence of values. Default: str()
+        :param headers: optional sequence of header labels (default: column names)
+        :param use_numpy: store columns in NumPy arrays (default: when numpy is installed)
+        """
+        self._np = _numpy() if use_numpy is None or use_numpy else None
+        if use_numpy and self._np is None:
+            raise ImportError("TableViewModel(use_numpy=True) requires numpy")
+
+        self._names = []
+        self._typecodes = []
+        for column in columns:
+            name, typecode = (column, None) if isinstance(column, str) else column
+            self._names.append(name)
+            self._typecodes.append(typecode)
+        self._column_index = {name: col for col, name in enumerate(self._names)}
+        if len(self._column_index) != len(self._names):
+            raise ValueError("duplicate column names")
+
+        data = data or {}
+        unknown = set(data) - set(self._names)
+        if unknown:
+            raise KeyError("unknown columns: " + ", ".join(sorted(map(str, unknown))))
+        lengths = {len(values) for values in data.values()}
+        if len(lengths) > 1:
+            raise ValueError("columns must have the same length")
+        self._row_count = lengths.pop() if lengths else 0
+        self._columns = [self._make_column(col, data[name] if name in data else self._fill(col, self._row_count))
+                         for col, name in enumerate(self._names)]
+
+        formats = formats or {}
+        self._formats = [formats.get(name) for name in self._names]
+        self._headers = list(headers) if headers is not None else list(self._names)
+        self._display = [None] * len(self._names)
+
+        super().__init__(model=dict(zip(self._names, self._columns)))
+
+    def column_index(self, col):
+        """
+        Column number of the column name (numbers are returned unchanged)
+        """
+        if isinstance(col, int):
+            return col
+        return self._column_index[col]
+
+    def column(self, col):
+        """
+        Backing store of the column (do not modify it directly, use update() or set_column())
+        """
+        return self._columns[self.column_index(col)]
+
+    def value(self, row, col):
+        """
+        Raw value of the cell as a Python object
+        """
+        col = self.column_index(col)
+        value = self._columns[col][row]
+        if self._np is not None and self._typecodes[col] is not None:
+            value = value.item()
+        return value
+
+    def set_value(self, row, col, value):
+        self.update([(row, col, value)])
+
+    def update(self, changes):
+        """
+        Apply a batch of cell changes and emit merged dataChanged rectangles
+        :param changes: iterable of (row, column name or number, value). Last value wins for repeated cells.
+        """
+        by_column = {}
+        for row, col, value in changes:
+            by_column.setdefault(self.column_index(col), {})[row] = value
+        if not by_column:
             return
-        index = self.index(row, 0)
-        self.dataChanged.emit(index, index)
-        self.item_property_changed.emit(item, prop, val)
+
+        cells = []
+        for col, changed in by_column.items():
+            rows = list(changed)
+            values = list(changed.values())
+            store = self._columns[col]
+            if self._np is not None:
+                store[rows] = values
+            else:
+                for row, value in zip(rows, values):
+                    store[row] = value
+            display = self._display[col]
+            if display is not None:
+                texts = self._format(col, store[rows] if self._np is not None else values)
+                for row, text in zip(rows, texts):
+                    display[row] = text
+            cells.extend((row, col) for row in rows)
+
+        for top, left, bottom, right in changed_rectangles(cells):
+            self.dataChanged.emit(self.index(top, left), self.index(bottom, right), [])
+
+    def set_column(self, col, values, row=0):
+        """
+        Replace a contiguous range of a column starting at row with values (one dataChanged notification)
+        """
+        col = self.column_index(col)
+        values = values if self._np is not None else list(values)
+        count = len(values)
+        if count == 0:
+            return
+        if row < 0 or row + count > self._row_count:
+            raise IndexError("rows %d..%d out of range" % (row, row + count - 1))
+        store = self._columns[col]
+        store[row:row + count] = values if self._np is not None else self._make_column(col, values)
+        if self._display[col] is not None:
+            self._display[col][row:row + count] = self._format(col, store[row:row + count])
+        self.dataChanged.emit(self.index(row, col), self.index(row + count - 1, col), [])
+
+    def append_rows(self, data):
+        """
+        Append rows with a single insert notification
+        :param data: dict of column name -> values (all of the same length); missing columns are filled with
+                     None (object columns) or 0
+        """
+        unknown = set(data) - set(self._names)
+        if unknown:
+            raise KeyError("unknown columns: " + ", ".join(sorted(map(str, unknown))))
+        lengths = {len(values) for values in data.values()}
+        if len(lengths) != 1:
+            raise ValueError("appended columns must have the same non-zero length")
+        count = lengths.pop()
+        if count == 0:
+            return
+
+        row = self._row_count
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        for col, name in enumerate(self._names):
+            added = self._make_column(col, data[name] if name in data else self._fill(col, count))
+            if self._np is not None:
+                self._columns[col] = self._np.concatenate((self._columns[col], added))
+            else:
+                self._columns[col].extend(added)
+            if self._display[col] is not None:
+                self._display[col].extend(self._format(col, added))
+        self._row_count += count
+        self._model = dict(zip(self._names, self._columns))
+        self.endInsertRows()
+
+    def remove_rows(self, row, count):
+        """
+        Remove count rows starting at row with a single remove notification
+        """
+        row = max(row, 0)
+        count = min(count, self._row_count - row)
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        for col in range(len(self._columns)):
+            if self._np is not None:
+                self._columns[col] = self._np.delete(self._columns[col], slice(row, row + count))
+            else:
+                del self._columns[col][row:row + count]
+            if self._display[col] is not None:
+                del self._display[col][row:row + count]
+        self._row_count -= count
+        self._model = dict(zip(self._names, self._columns))
+        self.endRemoveRows()
+
+    def clear_format_cache(self, col=None):
+        """
+        Drop cached display text of the column (all columns when col is None), e.g. after changing formats
+        """
+        if col is None:
+            self._display = [None] * len(self._names)
+        else:
+            self._display[self.column_index(col)] = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role):
+        """
+        Overrides QAbstractTableModel
+        """
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.DisplayRole:
+            display = self._display[col]
+            if display is None:
+                display = self._display[col] = self._format(col, self._columns[col])
+            return display[index.row()]
+        if role == Qt.EditRole:
+            return self.value(index.row(), col)
+        return None
+
+    def headerData(self, section, orientation, role):
+        """
+        Overrides QAbstractTableModel
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def _fill(self, col, count):
+        """
+        Values of count new cells of a column not given explicitly: None for object columns, 0 otherwise
+        """
+        return [None if self._typecodes[col] is None else 0] * count
+
+    def _make_column(self, col, values):
+        typecode = self._typecodes[col]
+        np = self._np
+        if np is not None:
+            if typecode is not None:
+                return np.asarray(values, dtype=typecode)
+            column = np.empty(len(values), dtype=object)
+            column[:] = list(values)
+            return column
+        if typecode is not None:
+            return array.array(typecode, values)
+        return list(values)
+
+    def _format(self, col, values):
+        """
+        Display text of a sequence of column values: list of strings
+        """
+        fmt = self._formats[col]
+        np = self._np
+        if callable(fmt):
+            return list(fmt(values))
+        if np is not None:
+            if fmt is not None and self._typecodes[col] is not None:
+                return np.char.mod(fmt, values).tolist()
+            values = values.tolist()
+        if fmt is None:
+            return [str(value) for value in values]
+        return [fmt % value for value in values]
@@ -0,0 +1,37 @@
+import os
+
+# tests run without a display unless a platform is chosen explicitly
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import pytest  # noqa: E402
+from PyQt5.QtCore import QtMsgType, qInstallMessageHandler  # noqa: E402
+from PyQt5.QtTest import QAbstractItemModelTester  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def model_tester(app):
+    """
+    Attach QAbstractItemModelTester to a model: model_tester(model).
+    The tester reports inconsistencies as Qt warnings, which fail the test.
+    """
+    warnings = []
+    testers = []
+
+    def handler(msg_type, context, message):
+        if msg_type != QtMsgType.QtDebugMsg:
+            warnings.append(message)
+
+    previous = qInstallMessageHandler(handler)
+
+    def attach(model):
+        testers.append(QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Warning))
+
+    yield attach
+    qInstallMessageHandler(previous)
+    assert not warnings
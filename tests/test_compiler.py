@@ -0,0 +1,98 @@
+import glob
+import os
+
+import pytest
+from PyQt5.QtWidgets import QLineEdit, QWidget
+
+from qtbind import compiler
+from qtbind.interfaces import IPropertyChanged
+from qtbind.loader import CACHE_DIR_ENV, load_ui
+from qtbind.view import View
+
+_UI = '''<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>Form</class>
+ <widget class="QWidget" name="Form">
+  <layout class="QVBoxLayout" name="layout">
+   <item>
+    <widget class="QLineEdit" name="edit">
+     <property name="text">
+      <binding path="name"/>
+     </property>
+    </widget>
+   </item>
+  </layout>
+ </widget>
+</ui>
+'''
+
+
+class Context(IPropertyChanged):
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+
+
+class Form(QWidget, View):
+    def __init__(self, context):
+        super().__init__()
+        View.__init__(self, context)
+
+
+@pytest.fixture
+def uifile(tmp_path):
+    path = tmp_path / 'form.ui'
+    path.write_text(_UI, encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def clear_loaded():
+    compiler._loaded.clear()
+    yield
+    compiler._loaded.clear()
+
+
+def test_load_ui_from_cache_binds_widgets(app, uifile, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    form = Form(Context('a'))
+    load_ui(uifile, form, cache_dir=cache_dir)
+    assert form.edit.text() == 'a'
+    form.context.name = 'b'
+    form.context.notify_property_changed('name', 'b')
+    assert form.edit.text() == 'b'
+
+
+def test_load_compiled_reuses_cached_bytecode(app, uifile, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    load_ui(uifile, Form(Context('a')), cache_dir=cache_dir)
+    code_files = glob.glob(os.path.join(cache_dir, '*.pyc'))
+    assert len(code_files) == 1
+
+    # a new process finds the bytecode and neither generates nor compiles the module again
+    compiler._loaded.clear()
+    for source_file in glob.glob(os.path.join(cache_dir, '*.py')):
+        os.remove(source_file)
+    form = Form(Context('c'))
+    load_ui(uifile, form, cache_dir=cache_dir)
+    assert form.edit.text() == 'c'
+
+
+def test_load_compiled_ignores_bytecode_of_other_python(app, uifile, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    load_ui(uifile, Form(Context('a')), cache_dir=cache_dir)
+    code_file, = glob.glob(os.path.join(cache_dir, '*.pyc'))
+    with open(code_file, 'wb') as f:
+        f.write(b'\0\0\0\0garbage')
+
+    compiler._loaded.clear()
+    form = Form(Context('d'))
+    load_ui(uifile, form, cache_dir=cache_dir)
+    assert form.edit.text() == 'd'
+
+
+def test_load_ui_without_baseinstance_with_cache_dir(app, uifile, tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / 'cache'))
+    widget = load_ui(uifile, None)
+    assert isinstance(widget, QWidget)
+    assert isinstance(widget.findChild(QLineEdit, 'edit'), QLineEdit)
@@ -0,0 +1,57 @@
+import gc
+
+from qtbind.interfaces import Event
+from qtbind.viewmodel import ListViewModel, ViewModel, ViewModelProperty
+
+
+class Person:
+    def __init__(self, name):
+        self.name = name
+
+
+class PersonViewModel(ViewModel):
+    name = ViewModelProperty('name')
+
+
+def test_event_handler_disconnecting_itself_does_not_skip_next_handler():
+    event = Event()
+    calls = []
+
+    def once(value):
+        calls.append(('once', value))
+        event.disconnect(connection)
+
+    connection = event.connect(once)
+    event.connect(lambda value: calls.append(('other', value)))
+    event.emit(1)
+    event.emit(2)
+    assert calls == [('once', 1), ('other', 1), ('other', 2)]
+
+
+def test_event_weak_handler_of_collected_object_does_not_skip_next_handler():
+    class Receiver:
+        def on_event(self, value):
+            pass
+
+    event = Event()
+    receiver = Receiver()
+    event.connect(receiver.on_event, weak=True)
+    calls = []
+    event.connect(calls.append)
+    del receiver
+    gc.collect()
+    event.emit(1)
+    assert calls == [1]
+
+
+def test_item_change_reaches_handlers_after_collected_container():
+    item = PersonViewModel(Person('a'))
+    vm = ListViewModel([item.model], init=[item])
+    changes = []
+    item.property_changed.connect(lambda prop, value: changes.append((prop, value)))
+    del vm
+    gc.collect()
+    item.name = 'b'
+    item.name = 'c'
+    assert changes == [('name', 'b'), ('name', 'c')]
+
@@ -0,0 +1,419 @@
+import random
+import threading
+from concurrent.futures import Future
+
+import pytest
+from PyQt5.QtWidgets import QComboBox, QLineEdit, QListWidget, QWidget
+
+from qtbind.interfaces import CoalescingNotifier, IPropertyChanged, property_dispatcher
+from qtbind.qtbind import BIND_READ, Binding, CollectionBinding, PropertyPath, RateLimiter, item_adapter
+from qtbind.view import BindingSpec, View
+from qtbind.viewmodel import ListViewModel, ViewModel, ViewModelProperty
+
+
+class Person(IPropertyChanged):
+    def __init__(self, name='', age=0):
+        super().__init__()
+        self._name = name
+        self._age = age
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self.notify_property_changed('name', value)
+
+    @property
+    def age(self):
+        return self._age
+
+    @age.setter
+    def age(self, value):
+        self._age = value
+        self.notify_property_changed('age', value)
+
+
+class Holder(IPropertyChanged):
+    """
+    Object notifying changes of any attribute set with set()
+    """
+    def __init__(self, **values):
+        super().__init__()
+        self.__dict__.update(values)
+
+    def set(self, name, value):
+        setattr(self, name, value)
+        self.notify_property_changed(name, value)
+
+
+class Item:
+    def __init__(self, name):
+        self.name = name
+
+
+class ItemViewModel(ViewModel):
+    name = ViewModelProperty('name')
+
+
+class ManualExecutor:
+    """
+    Executor running submitted calls only when run() is called
+    """
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, func):
+        future = Future()
+        self.pending.append((future, func))
+        return future
+
+    def run(self):
+        pending, self.pending = self.pending, []
+        for future, func in pending:
+            if future.set_running_or_notify_cancel():
+                future.set_result(func())
+
+
+def test_async_binding_does_not_refetch_its_own_write(app):
+    executor = ManualExecutor()
+    person = Person('a')
+    edit = QLineEdit()
+    binding = Binding(person, 'name', edit, 'text', executor=executor, placeholder='...')  # noqa: F841
+    assert edit.text() == '...'
+    executor.run()
+    assert edit.text() == 'a'
+
+    edit.setText('ab')
+    assert person.name == 'ab'
+    assert edit.text() == 'ab'
+    assert not executor.pending
+
+    person.name = 'x'
+    assert edit.text() == '...'
+    executor.run()
+    assert edit.text() == 'x'
+
+
+def test_async_binding_drops_pending_read_when_target_is_edited(app):
+    executor = ManualExecutor()
+    person = Person('a')
+    edit = QLineEdit()
+    binding = Binding(person, 'name', edit, 'text', executor=executor, placeholder='...')  # noqa: F841
+    executor.run()
+
+    person.name = 'b'
+    edit.setText('typed')
+    executor.run()
+    assert person.name == 'typed'
+    assert edit.text() == 'typed'
+
+
+class PersonView(QWidget, View):
+    bindings = (
+        BindingSpec('name', 'name_edit', 'text'),
+    )
+
+    def __init__(self, context=None):
+        super().__init__()
+        View.__init__(self, context)
+        self.name_edit = QLineEdit(self)
+        self.age_edit = QLineEdit(self)
+
+
+class PersonAgeView(PersonView):
+    bindings = PersonView.bindings + (
+        ('age', 'age_edit', 'text', BIND_READ),
+    )
+
+
+def test_binding_plan_extends_base_bindings_once(app):
+    plan = PersonAgeView.binding_plan()
+    assert [(widget, template.source_prop) for widget, template in plan] == [('name_edit', 'name'),
+                                                                           ('age_edit', 'age')]
+    view = PersonAgeView(Person('a', '5'))
+    view.bind_declared()
+    assert view.name_edit.text() == 'a'
+    view.context.name = 'b'
+    assert view.name_edit.text() == 'b'
+    assert len(view._bindings) == 2
+
+
+def test_binding_plan_rejects_duplicate_targets():
+    class DuplicateView(PersonView):
+        bindings = PersonView.bindings + PersonView.bindings
+
+    with pytest.raises(ValueError):
+        DuplicateView.binding_plan()
+
+
+def test_dispatcher_routes_by_property_name():
+    person = Person('a', 1)
+    calls = []
+    dispatcher = property_dispatcher(person)
+    on_name = lambda prop, value: calls.append(('name', prop, value))  # noqa: E731
+    dispatcher.subscribe('name', on_name)
+    dispatcher.subscribe('age', lambda prop, value: calls.append(('age', prop, value)))
+    assert dispatcher.handler_count() == 2
+
+    person.name = 'b'
+    assert calls == [('name', 'name', 'b')]
+    # all properties changed: every handler is called
+    person.notify_property_changed(None, None)
+    assert sorted(calls[1:]) == [('age', None, None), ('name', None, None)]
+
+    dispatcher.unsubscribe('name', on_name)
+    person.name = 'c'
+    assert len(calls) == 3
+    assert dispatcher.handler_count('name') == 0
+
+
+def test_batch_update_emits_last_value_once_per_property():
+    person = Person('a', 1)
+    calls = []
+    committed = []
+    person.property_changed.connect(lambda prop, value: calls.append((prop, value)))
+    person.batch_committed.connect(committed.append)
+    with person.batch_update():
+        person.name = 'b'
+        with person.batch_update():
+            person.age = 2
+            person.name = 'c'
+        assert calls == []
+    assert calls == [('name', 'c'), ('age', 2)]
+    assert committed == [('name', 'age')]
+
+
+def test_rate_limiter_debounce_and_throttle(app):
+    calls = []
+    debounce = RateLimiter(calls.append, 1000, debounce=True)
+    debounce(1)
+    debounce(2)
+    assert calls == [] and debounce.pending
+    debounce.flush()
+    assert calls == [2] and not debounce.pending
+
+    calls.clear()
+    throttle = RateLimiter(calls.append, 1000)
+    throttle(1)
+    throttle(2)
+    throttle(3)
+    # leading edge immediately, the last of the calls within the interval on flush
+    assert calls == [1]
+    throttle.flush()
+    assert calls == [1, 3]
+    # flush ends the interval: the next call is a leading edge again
+    throttle(4)
+    throttle(5)
+    throttle.cancel()
+    assert calls == [1, 3, 4] and not throttle.pending
+
+
+def test_debounced_binding_writes_source_on_flush(app):
+    person = Person('a')
+    edit = QLineEdit()
+    binding = Binding(person, 'name', edit, 'text', debounce_ms=1000)
+    edit.setText('ab')
+    edit.setText('abc')
+    assert person.name == 'a'
+    binding.flush()
+    assert person.name == 'abc'
+
+
+def test_skip_equal_binding_counts_skipped_writes(app):
+    person = Person('a')
+    edit = QLineEdit()
+    binding = Binding(person, 'name', edit, 'text', skip_equal=True)
+    assert edit.text() == 'a'
+    person.notify_property_changed('name', 'a')
+    person.notify_property_changed('name', 'a')
+    assert binding.skipped_updates == 2
+    person.name = 'b'
+    assert edit.text() == 'b'
+    assert binding.skipped_updates == 2
+
+
+def test_comparator_binding_skips_values_within_tolerance(app):
+    holder = Holder(value=1.0)
+    edit = QLineEdit()
+    binding = Binding(holder, 'value', edit, 'text', flags=BIND_READ, source_to_target=lambda value: '%.3f' % value,
+                      comparator=lambda a, b: abs(float(a) - float(b)) < 0.01)
+    assert edit.text() == '1.000'
+    holder.set('value', 1.001)
+    assert edit.text() == '1.000'
+    assert binding.skipped_updates == 1
+    holder.set('value', 1.5)
+    assert edit.text() == '1.500'
+
+
+def test_property_path_resubscribes_below_replaced_object():
+    first = Holder(name='a')
+    second = Holder(name='b')
+    group = Holder(current=first)
+    root = Holder(group=group)
+    calls = []
+    path = PropertyPath('group.current.name', lambda prop, value: calls.append((prop, value)))
+    path.set_root(root)
+    assert path.value() == 'a'
+
+    first.set('name', 'a2')
+    assert calls == [('name', 'a2')]
+
+    group.set('current', second)
+    assert calls[-1] == ('name', 'b')
+    assert property_dispatcher(first).handler_count() == 0
+    assert property_dispatcher(second).handler_count('name') == 1
+    first.set('name', 'a3')
+    assert len(calls) == 2
+    second.set('name', 'b2')
+    assert calls[-1] == ('name', 'b2')
+
+    # replacing the top object rebuilds the whole chain
+    other = Holder(current=Holder(name='c'))
+    root.set('group', other)
+    assert calls[-1] == ('name', 'c')
+    assert property_dispatcher(group).handler_count() == 0
+    assert property_dispatcher(second).handler_count() == 0
+    group.set('current', first)
+    assert calls[-1] == ('name', 'c')
+
+    root.set('group', None)
+    assert calls[-1] == ('name', None)
+    assert path.value() is None
+    path.set_root(None)
+    assert property_dispatcher(root).handler_count() == 0
+
+
+def test_dotted_binding_writes_current_leaf(app):
+    first = Person('a')
+    second = Person('b')
+    holder = Holder(current=first)
+    edit = QLineEdit()
+    binding = Binding(holder, 'current.name', edit, 'text')  # noqa: F841
+    assert edit.text() == 'a'
+    holder.set('current', second)
+    assert edit.text() == 'b'
+    edit.setText('typed')
+    assert (first.name, second.name) == ('a', 'typed')
+    first.name = 'ignored'
+    assert edit.text() == 'typed'
+
+
+def check_items(widget, vm, current):
+    items = item_adapter(widget)
+    assert items.texts() == [item.name for item in vm]
+    if current is not None and vm.row_of(current) >= 0:
+        assert items.current() == vm.row_of(current)
+
+
+@pytest.mark.parametrize('widget_type', [QComboBox, QListWidget])
+@pytest.mark.parametrize('seed', range(4))
+def test_collection_binding_applies_model_deltas(app, widget_type, seed):
+    rng = random.Random(seed)
+    names = iter('p%d' % i for i in range(10 ** 6))
+
+    def new_items(count):
+        return [ItemViewModel(Item(next(names))) for _ in range(count)]
+
+    items = new_items(rng.randint(5, 20))
+    vm = ListViewModel([item.model for item in items], init=list(items))
+    holder = Holder(people=vm)
+    widget = widget_type()
+    binding = CollectionBinding(holder, 'people', widget, display=lambda item: item.name)  # noqa: F841
+    adapter = item_adapter(widget)
+    check_items(widget, vm, None)
+
+    for _ in range(200):
+        size = len(vm)
+        current = vm[adapter.current()] if size and adapter.current() >= 0 else None
+        if size and rng.random() < 0.3:
+            adapter.set_current(rng.randrange(size))
+            current = vm[adapter.current()]
+        operation = rng.randrange(5)
+        if operation == 0 or size < 3:
+            row = rng.randrange(size + 1)
+            for offset, item in enumerate(new_items(rng.randint(1, 3))):
+                vm.insert(row + offset, item)
+        elif operation == 1:
+            vm.remove_range(rng.randrange(size), rng.randint(1, 2))
+        elif operation == 2:
+            # block moves, forwards and backwards
+            count = rng.randint(1, min(3, size))
+            row = rng.randrange(size - count + 1)
+            dest = rng.randrange(size + 1)
+            if not row <= dest <= row + count:
+                vm.move(row, dest, count)
+        elif operation == 3:
+            new_list = [item for item in vm if rng.random() < 0.9] + new_items(rng.randrange(3))
+            rng.shuffle(new_list)
+            vm.replace(new_list)
+        else:
+            rng.choice(list(vm)).name = next(names)
+            vm.flush_changes()
+        check_items(widget, vm, current)
+
+    # a new list replaces the items
+    other = ListViewModel([], init=new_items(3))
+    holder.set('people', other)
+    check_items(widget, other, None)
+    vm.insert(0, new_items(1)[0])
+    check_items(widget, other, None)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_collection_binding_replaces_changed_part_of_plain_list(app, seed):
+    rng = random.Random(seed)
+    holder = Holder(names=['n%d' % i for i in range(rng.randint(0, 10))])
+    widget = QListWidget()
+    binding = CollectionBinding(holder, 'names', widget)  # noqa: F841
+    adapter = item_adapter(widget)
+    counter = iter(range(100, 10 ** 6))
+
+    for _ in range(100):
+        old = list(holder.names)
+        new = list(old)
+        start = rng.randrange(len(new) + 1)
+        end = rng.randrange(start, len(new) + 1)
+        # repeated texts make the unchanged prefix and suffix overlap
+        new[start:end] = ['n%d' % (next(counter) if rng.random() < 0.5 else rng.randrange(3))
+                          for _ in range(rng.randrange(4))]
+        if old and rng.random() < 0.5:
+            adapter.set_current(rng.randrange(len(old)))
+        current = adapter.current()
+        # list items are identified by text: current rows in the unchanged prefix keep their row
+        prefix = 0
+        while prefix < min(len(old), len(new)) and old[prefix] == new[prefix]:
+            prefix += 1
+
+        holder.set('names', new)
+        assert adapter.texts() == new
+        if 0 <= current < prefix:
+            assert adapter.current() == current
+
+
+def test_coalescing_notifier_delivers_latest_value_per_property(app):
+    notifier = CoalescingNotifier(interval_ms=1000)
+    person = Person('a', 1)
+    calls = []
+    person.property_changed.connect(lambda prop, value: calls.append((prop, value)))
+
+    def post(thread):
+        for i in range(100):
+            notifier.post(person, 'name', (thread, i))
+        notifier.post(person, 'age', thread)
+
+    threads = [threading.Thread(target=post, args=(thread,)) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == []
+    assert notifier.queue_depth == 2
+
+    notifier.drain()
+    assert [prop for prop, _ in calls] == ['name', 'age']
+    assert calls[0][1][1] == 99
+    stats = notifier.stats()
+    assert (stats['posted'], stats['delivered'], stats['dropped'], stats['queue_depth']) == (404, 2, 402, 0)
@@ -0,0 +1,564 @@
+import gc
+import random
+import threading
+import weakref
+
+import pytest
+from PyQt5.QtCore import QModelIndex, QPersistentModelIndex, Qt
+
+from qtbind.interfaces import property_dispatcher
+from qtbind.viewmodel import (LazyListViewModel, ListViewModel, SortedFilteredListViewModel, TableViewModel, TreeViewModel,
+                              ViewModel, ViewModelProperty, changed_rectangles, computed)
+
+
+class Person:
+    def __init__(self, uid, name='', age=0):
+        self.uid = uid
+        self.name = name
+        self.age = age
+
+
+class PersonViewModel(ViewModel):
+    name = ViewModelProperty('name')
+    age = ViewModelProperty('age')
+
+    @property
+    def uid(self):
+        return self.model.uid
+
+
+class Mirror:
+    """
+    Plain list of a list model's items maintained only from the model's change notifications
+    """
+    def __init__(self, model):
+        self.items = [model[row] for row in range(model.rowCount(QModelIndex()))]
+        self._model = model
+        model.rowsInserted.connect(self._on_inserted)
+        model.rowsRemoved.connect(self._on_removed)
+        model.rowsMoved.connect(self._on_moved)
+        model.dataChanged.connect(self._on_data_changed)
+        model.modelReset.connect(self._on_reset)
+        # layout changes carry no row mapping: the new order is read back from the model
+        model.layoutChanged.connect(self._on_reset)
+
+    def _on_inserted(self, parent, first, last):
+        self.items[first:first] = [self._model[row] for row in range(first, last + 1)]
+
+    def _on_removed(self, parent, first, last):
+        del self.items[first:last + 1]
+
+    def _on_moved(self, parent, start, end, destination, row):
+        moved = self.items[start:end + 1]
+        del self.items[start:end + 1]
+        if row > start:
+            row -= len(moved)
+        self.items[row:row] = moved
+
+    def _on_data_changed(self, top_left, bottom_right, roles):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self.items[row] = self._model[row]
+
+    def _on_reset(self):
+        self.items = [self._model[row] for row in range(self._model.rowCount(QModelIndex()))]
+
+
+def new_people(rng, uids, count):
+    people = []
+    for _ in range(count):
+        uid = next(uids)
+        people.append(PersonViewModel(Person(uid, 'n%d' % rng.randrange(10), rng.randrange(40))))
+    return people
+
+
+def check_list(vm, mirror, expected):
+    assert list(vm) == expected
+    assert vm.model == [item.model for item in expected]
+    assert mirror.items == expected
+    assert [vm.row_of(item) for item in expected] == list(range(len(expected)))
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_list_view_model_random_edits(model_tester, seed):
+    rng = random.Random(seed)
+    uids = iter(range(10 ** 6))
+    expected = new_people(rng, uids, rng.randrange(30))
+    vm = ListViewModel([item.model for item in expected], init=list(expected))
+    model_tester(vm)
+    mirror = Mirror(vm)
+
+    for _ in range(300):
+        size = len(expected)
+        operation = rng.randrange(5)
+        if operation == 0 or size < 5:
+            row = rng.randrange(size + 1)
+            items = new_people(rng, uids, rng.randint(1, 3))
+            if len(items) == 1:
+                vm.insert(row, items[0])
+            else:
+                vm.extend(items)
+                row = size
+            expected[row:row] = items
+        elif operation == 1:
+            row = rng.randrange(size)
+            count = rng.randint(1, 4)
+            vm.remove_range(row, count)
+            del expected[row:row + count]
+        elif operation == 2:
+            row = rng.randrange(size)
+            count = rng.randint(1, min(4, size - row))
+            dest = rng.randrange(size + 1)
+            vm.move(row, dest, count)
+            if not row <= dest <= row + count:
+                moved = expected[row:row + count]
+                del expected[row:row + count]
+                dest = dest - count if dest > row else dest
+                expected[dest:dest] = moved
+        elif operation == 3:
+            # keep most items, drop some, add new ones, shuffle part of the order
+            items = [item for item in expected if rng.random() < 0.9] + new_people(rng, uids, rng.randrange(4))
+            for _ in range(rng.randrange(4) if items else 0):
+                i, j = rng.randrange(len(items)), rng.randrange(len(items))
+                items[i], items[j] = items[j], items[i]
+            vm.replace(items)
+            expected = items
+        else:
+            # replace by key: items with a known uid are new objects replacing the old ones in place
+            items = [PersonViewModel(Person(item.uid)) if rng.random() < 0.2 else item
+                     for item in expected if rng.random() < 0.9]
+            row = rng.randrange(len(items) + 1)
+            items[row:row] = new_people(rng, uids, rng.randrange(3))
+            if rng.random() < 0.2:
+                rng.shuffle(items)
+            vm.replace(items, key=lambda item: item.uid)
+            expected = items
+        check_list(vm, mirror, expected)
+
+
+def test_list_view_model_remove_item(model_tester):
+    rng = random.Random(1)
+    expected = new_people(rng, iter(range(100)), 100)
+    vm = ListViewModel([item.model for item in expected], init=list(expected))
+    model_tester(vm)
+    mirror = Mirror(vm)
+    for _ in range(60):
+        item = rng.choice(expected)
+        vm.remove(item)
+        expected.remove(item)
+        check_list(vm, mirror, expected)
+    vm.remove(PersonViewModel(Person(-1)))
+    check_list(vm, mirror, expected)
+
+
+def rectangle_cells(rectangles):
+    cells = []
+    for top, left, bottom, right in rectangles:
+        cells.extend((row, col) for row in range(top, bottom + 1) for col in range(left, right + 1))
+    return cells
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_changed_rectangles_cover_changed_cells(seed):
+    rng = random.Random(seed)
+    rows, cols = rng.randint(1, 30), rng.randint(1, 8)
+    density = rng.random()
+    cells = [(row, col) for row in range(rows) for col in range(cols) if rng.random() < density]
+    changes = cells + [rng.choice(cells) for _ in range(len(cells) // 4)] if cells else []
+    rng.shuffle(changes)
+
+    rectangles = changed_rectangles(changes)
+    covered = rectangle_cells(rectangles)
+    # every changed cell is covered exactly once and nothing else is
+    assert sorted(covered) == sorted(set(cells))
+    assert rectangles == sorted(rectangles)
+    # runs of adjacent columns are maximal and equal runs of consecutive rows are merged
+    by_row = {}
+    for top, left, bottom, right in rectangles:
+        for row in range(top, bottom + 1):
+            by_row.setdefault(row, []).append((left, right))
+    for runs in by_row.values():
+        runs.sort()
+        assert all(a[1] + 1 < b[0] for a, b in zip(runs, runs[1:]))
+    spans = {(top, bottom, left, right) for top, left, bottom, right in rectangles}
+    for top, bottom, left, right in spans:
+        assert not any(other[0] == bottom + 1 and other[2:] == (left, right) for other in spans)
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_table_view_model_random_updates(model_tester, seed):
+    rng = random.Random(seed)
+    rows = rng.randint(1, 40)
+    names = ['id', 'price', 'symbol']
+    expected = {'id': list(range(rows)), 'price': [float(row) for row in range(rows)],
+                'symbol': ['s%d' % row for row in range(rows)]}
+    data = {name: list(values) for name, values in expected.items()}
+    table = TableViewModel([('id', 'q'), ('price', 'd'), 'symbol'], data=data, formats={'price': '%.2f'},
+                           use_numpy=False)
+    model_tester(table)
+    emitted = []
+    table.dataChanged.connect(lambda top_left, bottom_right, roles: emitted.append(
+        (top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column())))
+
+    for _ in range(50):
+        changes = []
+        for _ in range(rng.randrange(1, 30)):
+            row, col = rng.randrange(rows), rng.randrange(len(names))
+            name = names[col]
+            value = {'id': rng.randrange(1000), 'price': rng.random() * 100, 'symbol': 's%d' % rng.randrange(99)}[name]
+            changes.append((row, name if rng.random() < 0.5 else col, value))
+            expected[name][row] = value
+        del emitted[:]
+        table.update(changes)
+
+        changed = {(row, table.column_index(col)) for row, col, _ in changes}
+        assert sorted(rectangle_cells(emitted)) == sorted(changed)
+        for name in names:
+            assert [table.value(row, name) for row in range(rows)] == expected[name]
+        assert [table.data(table.index(row, 1), Qt.DisplayRole) for row in range(rows)] == \
+            ['%.2f' % value for value in expected['price']]
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_sorted_filtered_list_view_model_random_edits(model_tester, seed):
+    rng = random.Random(seed)
+    uids = iter(range(10 ** 6))
+    items = new_people(rng, uids, rng.randrange(40))
+    source = ListViewModel([item.model for item in items], init=list(items))
+    state = {'key': lambda item: item.name, 'predicate': lambda item: item.age >= 18, 'reverse': seed % 2 == 1}
+    view = SortedFilteredListViewModel(source, key=state['key'], predicate=state['predicate'],
+                                       reverse=state['reverse'], sort_properties=['name'], filter_properties=['age'])
+    model_tester(view)
+    mirror = Mirror(view)
+    for _ in range(300):
+        size = len(items)
+        operation = rng.randrange(7)
+        if operation == 0 or size < 5:
+            row = rng.randrange(size + 1)
+            new_items = new_people(rng, uids, rng.randint(1, 3))
+            for i, item in enumerate(new_items):
+                source.insert(row + i, item)
+            items[row:row] = new_items
+        elif operation == 1:
+            row = rng.randrange(size)
+            count = rng.randint(1, 3)
+            source.remove_range(row, count)
+            del items[row:row + count]
+        elif operation == 2:
+            row = rng.randrange(size)
+            dest = rng.randrange(size + 1)
+            source.move(row, dest)
+            if not row <= dest <= row + 1:
+                items.insert(dest - 1 if dest > row else dest, items.pop(row))
+        elif operation == 3:
+            new_items = [item for item in items if rng.random() < 0.9] + new_people(rng, uids, rng.randrange(4))
+            rng.shuffle(new_items)
+            source.replace(new_items)
+            items = new_items
+        elif operation == 4:
+            rng.choice(items).name = 'n%d' % rng.randrange(10)
+        elif operation == 5:
+            rng.choice(items).age = rng.randrange(40)
+        else:
+            # key and predicate depend only on the declared sort_properties and filter_properties
+            if rng.random() < 0.5:
+                state['key'] = rng.choice([lambda item: item.name, lambda item: item.name[::-1], None])
+                state['reverse'] = rng.random() < 0.5
+                view.set_key(state['key'], state['reverse'])
+            else:
+                state['predicate'] = rng.choice([lambda item: item.age >= 18, lambda item: item.age % 3 != 0, None])
+                view.set_predicate(state['predicate'])
+
+        # source order breaks ties of equal keys (sort() is stable)
+        key, predicate = state['key'], state['predicate']
+        shown = [item for item in items if predicate is None or predicate(item)]
+        shown.sort(key=lambda item: key(item) if key is not None else 0)
+        if state['reverse']:
+            shown.reverse()
+        assert [view[row] for row in range(len(view))] == shown
+        assert mirror.items == shown
+        assert [view.row_of(item) for item in shown] == list(range(len(shown)))
+
+
+def test_sorted_filtered_list_view_model_follows_source_order(model_tester):
+    items = new_people(random.Random(0), iter(range(100)), 5)
+    source = ListViewModel([item.model for item in items], init=list(items))
+    view = SortedFilteredListViewModel(source, predicate=lambda item: item.uid != 2)
+    model_tester(view)
+    mirror = Mirror(view)
+    persistent = QPersistentModelIndex(view.index(view.row_of(items[4]), 0))
+
+    first = new_people(random.Random(1), iter(range(100, 101)), 1)[0]
+    source.insert(0, first)
+    assert list(view) == mirror.items == [first] + items[:2] + items[3:]
+    source.move(5, 1)
+    assert list(view) == mirror.items == [first, items[4], items[0], items[1], items[3]]
+    assert persistent.row() == 1
+    # moving a hidden item does not change the shown order
+    source.move(4, 0)
+    assert list(view) == mirror.items == [first, items[4], items[0], items[1], items[3]]
+
+
+def person_delegate(item, role):
+    return item.name if role == Qt.DisplayRole else None
+
+
+def test_lazy_list_view_model_reuses_live_evicted_items(model_tester):
+    created = []
+
+    def factory(person):
+        created.append(PersonViewModel(person))
+        return created[-1]
+
+    people = [Person(uid, 'n%d' % uid) for uid in range(50)]
+    vm = LazyListViewModel(people, factory, data_delegate=person_delegate, cache_data=True, cache_size=4)
+    model_tester(vm)
+    held = vm[3]
+    assert vm.data(vm.index(3, 0), Qt.DisplayRole) == 'n3'
+    for row in range(10, 30):
+        vm[row]
+    assert vm[3] is held
+
+    for row in range(10, 30):
+        vm[row]
+    changed = []
+    vm.dataChanged.connect(lambda top_left, bottom_right, roles: changed.append((top_left.row(), bottom_right.row())))
+    held.name = 'changed'
+    vm.flush_changes()
+    assert changed == [(3, 3)]
+    assert vm.data(vm.index(3, 0), Qt.DisplayRole) == 'changed'
+    assert vm.row_of(held) == 3
+
+    # once collected, an evicted item view model is disconnected and created again on access
+    for row in range(10, 30):
+        vm[row]
+    ref = weakref.ref(held)
+    del held
+    del created[:]
+    gc.collect()
+    assert ref() is None
+    assert len(vm._subscriptions) == len(vm._cache)
+    vm[3]
+    assert len(created) == 1
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_lazy_list_view_model_random_edits(model_tester, seed):
+    rng = random.Random(seed)
+    uids = iter(range(10 ** 6))
+    expected = [Person(next(uids), 'n%d' % rng.randrange(10)) for _ in range(rng.randrange(40))]
+    vm = LazyListViewModel(list(expected), PersonViewModel, data_delegate=person_delegate, cache_data=True,
+                           cache_size=rng.randint(1, 8))
+    model_tester(vm)
+    held = []
+
+    for _ in range(300):
+        size = len(expected)
+        operation = rng.randrange(5)
+        if operation == 0 or size < 5:
+            row = rng.randrange(size + 1)
+            person = Person(next(uids), 'n%d' % rng.randrange(10))
+            vm.insert(row, person)
+            expected.insert(row, person)
+        elif operation == 1:
+            row = rng.randrange(size)
+            count = rng.randint(1, 3)
+            vm.remove_range(row, count)
+            del expected[row:row + count]
+        elif operation == 2:
+            row = rng.randrange(size)
+            count = rng.randint(1, min(4, size - row))
+            dest = rng.randrange(size + 1)
+            vm.move(row, dest, count)
+            if not row <= dest <= row + count:
+                moved = expected[row:row + count]
+                del expected[row:row + count]
+                dest = dest - count if dest > row else dest
+                expected[dest:dest] = moved
+        elif operation == 3:
+            # keep some item view models alive outside of the list and edit them
+            item = vm[rng.randrange(size)]
+            if rng.random() < 0.5:
+                held.append(item)
+            if held:
+                rng.choice(held).name = 'e%d' % rng.randrange(10)
+            vm.flush_changes()
+        else:
+            del held[:rng.randrange(len(held) + 1)]
+            gc.collect()
+
+        assert vm.model == expected
+        assert [vm[row].model for row in range(len(vm))] == expected
+        assert [vm.data(vm.index(row, 0), Qt.DisplayRole) for row in range(len(vm))] == \
+            [person.name for person in expected]
+        for item in held:
+            row = vm.row_of(item)
+            assert (row >= 0 and vm[row] is item) if any(item.model is person for person in expected) else row == -1
+
+
+class Group:
+    def __init__(self, prefix):
+        self.prefix = prefix
+
+
+class GroupViewModel(ViewModel):
+    prefix = ViewModelProperty('prefix')
+
+
+class MemberViewModel(PersonViewModel):
+    def __init__(self, person, group):
+        super().__init__(person)
+        self.group = group
+
+    @computed
+    def label(self):
+        return self.group.prefix + self.name
+
+
+def test_computed_tracks_dependencies_of_other_view_models():
+    group = GroupViewModel(Group('a:'))
+    member = MemberViewModel(Person(1, 'x'), group)
+    changes = []
+    member.property_changed.connect(lambda prop, value: changes.append((prop, value)))
+    assert member.label == 'a:x'
+    group.prefix = 'b:'
+    member.name = 'y'
+    assert changes == [('label', 'b:x'), ('name', 'y'), ('label', 'b:y')]
+    assert member.label == 'b:y'
+
+
+def test_computed_does_not_keep_view_models_alive():
+    group = GroupViewModel(Group('a:'))
+    members = [MemberViewModel(Person(uid, 'n%d' % uid), group) for uid in range(100)]
+    assert [member.label for member in members[:2]] == ['a:n0', 'a:n1']
+    for member in members:
+        member.label
+    refs = [weakref.ref(member) for member in members]
+    assert property_dispatcher(group).handler_count('prefix') == 100
+
+    del members, member
+    gc.collect()
+    assert not any(ref() for ref in refs)
+    assert property_dispatcher(group).handler_count('prefix') == 0
+
+
+def test_computed_ignores_reads_on_other_threads():
+    group = GroupViewModel(Group('a:'))
+    other = PersonViewModel(Person(2, 'other'))
+
+    class Reader(PersonViewModel):
+        @computed
+        def label(self):
+            # a read made on another thread while the getter runs is not a dependency
+            thread = threading.Thread(target=lambda: other.name)
+            thread.start()
+            thread.join()
+            return group.prefix + self.name
+
+    reader = Reader(Person(1, 'x'))
+    assert reader.label == 'a:x'
+    assert property_dispatcher(other).handler_count('name') == 0
+    assert property_dispatcher(group).handler_count('prefix') == 1
+
+
+class Forest:
+    """
+    Plain oracle of a hierarchy: children lists of PersonViewModel items (None key for the roots)
+    """
+    def __init__(self, rng, uids):
+        self.rng = rng
+        self.uids = uids
+        self.children = {}
+        self.roots = self.grow(3)
+
+    def grow(self, depth):
+        items = new_people(self.rng, self.uids, self.rng.randrange(5))
+        for item in items:
+            self.children[id(item)] = self.grow(depth - 1) if depth > 1 else []
+        return items
+
+    def new_item(self):
+        item = new_people(self.rng, self.uids, 1)[0]
+        self.children[id(item)] = self.grow(1)
+        return item
+
+    def items(self, parent=None):
+        result = []
+        for item in self.roots if parent is None else self.children[id(parent)]:
+            result.append(item)
+            result.extend(self.items(item))
+        return result
+
+
+def check_tree(tree, forest, parent_index=QModelIndex(), items=None):
+    items = forest.roots if items is None else items
+    assert tree.rowCount(parent_index) == len(items)
+    for row, item in enumerate(items):
+        index = tree.index(row, 0, parent_index)
+        assert tree.item(index) is item
+        assert tree.index_of(item) == index
+        assert tree.parent(index) == parent_index
+        assert tree.data(index, Qt.DisplayRole) == item.name
+        loaded = tree.loaded_children(item)
+        if loaded is not None:
+            check_tree(tree, forest, index, forest.children[id(item)])
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_tree_view_model_random_edits(model_tester, seed):
+    rng = random.Random(seed)
+    forest = Forest(rng, iter(range(10 ** 6)))
+    tree = TreeViewModel(list(forest.roots), children=lambda item: list(forest.children[id(item)]),
+                         has_children=lambda item: bool(forest.children[id(item)]), data_delegate=person_delegate)
+    model_tester(tree)
+
+    for _ in range(200):
+        shown = [item for item in forest.items() if tree.index_of(item).isValid()]
+        loaded = [item for item in shown if tree.loaded_children(item) is not None]
+        operation = rng.randrange(6)
+        if operation == 0:
+            unloaded = [item for item in shown if tree.loaded_children(item) is None]
+            if unloaded:
+                index = tree.index_of(rng.choice(unloaded))
+                assert tree.canFetchMore(index)
+                tree.fetchMore(index)
+                assert not tree.canFetchMore(index)
+        elif operation == 1:
+            parent = rng.choice(loaded + [None])
+            siblings = forest.roots if parent is None else forest.children[id(parent)]
+            row = rng.randrange(len(siblings) + 1)
+            item = forest.new_item()
+            tree.insert(parent, row, item)
+            siblings.insert(row, item)
+        elif operation == 2:
+            if shown:
+                item = rng.choice(shown)
+                parent = tree.parent_of(item)
+                tree.remove(item)
+                (forest.roots if parent is None else forest.children[id(parent)]).remove(item)
+        elif operation == 3 and loaded:
+            tree.reload(rng.choice(loaded))
+        elif operation == 4:
+            if shown:
+                rng.choice(shown).name = 'r%d' % rng.randrange(10)
+        elif loaded:
+            # a duplicate child is rejected without changing the model
+            item = rng.choice(loaded)
+            with pytest.raises(ValueError):
+                tree.insert(item, 0, rng.choice(forest.roots + [item]))
+        assert tree.model == forest.roots
+        check_tree(tree, forest)
+
+
+def test_tree_view_model_rejects_duplicate_children_before_inserting(app):
+    # no model tester: it would fetch the children itself, and exceptions raised in Qt virtuals abort
+    root = PersonViewModel(Person(1, 'root'))
+    child = PersonViewModel(Person(2, 'child'))
+    tree = TreeViewModel([root], children=lambda item: [child, child] if item is root else [])
+    index = tree.index(0, 0)
+    inserted = []
+    tree.rowsAboutToBeInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    with pytest.raises(ValueError):
+        tree.fetchMore(index)
+    assert inserted == []
+    assert tree.rowCount(index) == 0
+    assert tree.loaded_children(root) is None